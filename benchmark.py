@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# ==============================================
+#   GVDILIX WORDLIST FORGE - BENCHMARK SUITE
+#   Per-stage throughput + peak memory baselines
+# ==============================================
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import gvdilix
+
+
+# ==========[ SYNTHETIC PROFILES ]==========
+def synthetic_profiles():
+    """Profiles of increasing size, from a bare name to comma lists everywhere"""
+    small = {"name": "John", "birth": "1990", "phone": "1234567890"}
+    medium = {
+        "name": "John", "surname": "Doe", "nick": "johnny,jd", "birth": "1990",
+        "city": "London", "country": "UK", "team": "lakers", "sport": "football",
+        "hobby": "gaming,reading", "phone": "1234567890", "favorite": "password,secret",
+    }
+    large = dict(medium)
+    large.update({
+        "spouse": "Jane", "child": "Max", "pet": "Rex", "mother": "Mary", "father": "Bob",
+        "anniversary": "14022015", "player": "lebron,kobe,magic", "job": "engineer",
+        "company": "acme", "school": "lincoln", "university": "oxford", "car": "civic",
+        "bike": "ducati", "email_local": "jdoe", "hobby": "gaming,reading,chess,surfing,hiking",
+        "favorite": "password,secret,dragon,monkey,sunshine,shadow",
+    })
+    return {"small": small, "medium": medium, "large": large}
+
+
+# ==========[ MEASUREMENTS ]==========
+def timed(func, *args):
+    """Run func once, return (result, seconds)"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def rate(count, seconds):
+    return round(count / seconds) if seconds > 0 else None
+
+
+def measure_stages(profile, target, seed, output):
+    """Time every PasswordGenerator stage and the writer separately"""
+    generator = gvdilix.PasswordGenerator(profile, seed=seed, verbose=False, stats=gvdilix.GenerationStats())
+    stages = {}
+
+    words, seconds = timed(generator.extract_words)
+    stages['extract_words'] = {'seconds': seconds, 'items': len(words), 'per_second': rate(len(words), seconds)}
+
+    leet, seconds = timed(lambda: [v for word in words for v in gvdilix.get_leet_variations(word, generator.leet)])
+    stages['get_leet_variations'] = {'seconds': seconds, 'items': len(leet), 'per_second': rate(len(leet), seconds)}
+
+    unique_words = generator.derive_words()
+    base, seconds = timed(generator.generate_base_combinations, unique_words)
+    stages['generate_base_combinations'] = {'seconds': seconds, 'items': len(base),
+                                            'per_second': rate(len(base), seconds)}
+
+    # The generator's own stage boundaries, so work done before a stage's
+    # first yield is not charged to the stage before it
+    passwords = list(generator.iter_variations(base, target))
+    for stage, measured in generator.stats.report()['stages'].items():
+        seconds, accepted = measured['wall_seconds'], measured['accepted']
+        stages[f"expand.{stage}"] = {'seconds': seconds, 'items': accepted, 'per_second': rate(accepted, seconds)}
+
+    written, seconds = timed(gvdilix.write_wordlist, output, passwords)
+    stages['write_wordlist'] = {'seconds': seconds, 'items': written, 'per_second': rate(written, seconds)}
+    return stages
+
+
+def measure_end_to_end(profile, target, seed):
+    """Full generate() run: wall time plus tracemalloc peak"""
+    generator = gvdilix.PasswordGenerator(profile, seed=seed, verbose=False)
+    tracemalloc.start()
+    try:
+        passwords, seconds = timed(generator.generate, target)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'seconds': seconds, 'items': len(passwords), 'per_second': rate(len(passwords), seconds),
+            'peak_mb': round(peak / 2 ** 20, 2)}
+
+
+def best_of(runs):
+    """Merge repeated stage measurements, keeping each stage's fastest run.
+
+    Single runs of the small stages vary by tens of percent, the minimum is
+    the stable estimate of what the code costs. The spread between the
+    fastest and slowest run is kept as that stage's noise.
+    """
+    best = {}
+    slowest = {}
+    for stages in runs:
+        for stage, measured in stages.items():
+            if stage not in best or measured['seconds'] < best[stage]['seconds']:
+                best[stage] = measured
+            slowest[stage] = max(slowest.get(stage, 0.0), measured['seconds'])
+    return {stage: dict(measured, spread_seconds=slowest[stage] - measured['seconds'])
+            for stage, measured in best.items()}
+
+
+def run_suite(sizes, profile_names, seed, output, with_memory=True, repeat=5):
+    profiles = synthetic_profiles()
+    cases = {}
+    for profile_name in profile_names:
+        for size in sizes:
+            key = f"{profile_name}/{size}"
+            print(f"[+] {key} (best of {repeat})...")
+            case = {'stages': best_of(measure_stages(profiles[profile_name], size, seed, output)
+                                      for _ in range(repeat))}
+            if with_memory:
+                runs = [measure_end_to_end(profiles[profile_name], size, seed) for _ in range(repeat)]
+                case['end_to_end'] = dict(min(runs, key=lambda run: run['seconds']),
+                                          peak_mb=max(run['peak_mb'] for run in runs))
+            cases[key] = case
+            total = sum(stage['seconds'] for stage in case['stages'].values())
+            print(f"    {total:.3f}s over {len(case['stages'])} stages"
+                  + (f", peak {case['end_to_end']['peak_mb']} MB" if with_memory else ""))
+    for leftover in (output, gvdilix.LineIndex.index_path(output)):
+        if os.path.exists(leftover):
+            os.remove(leftover)
+    return {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'seed': seed,
+        'repeat': repeat,
+        'cases': cases,
+    }
+
+
+# ==========[ BASELINE COMPARISON ]==========
+def compare(results, baseline, tolerance, min_delta=0.005):
+    """Return regression messages for stages slower (or peaks larger) than tolerance allows.
+
+    A stage may also slow down by its measured noise (the larger spread of
+    the two runs) or min_delta seconds, whichever is larger, before it is
+    flagged.
+    """
+    regressions = []
+    if baseline.get('repeat', 1) != results['repeat']:
+        print(f"[!] Baseline took the best of {baseline.get('repeat', 1)} runs, this run the best of "
+              f"{results['repeat']}: timings are less comparable")
+    for key, case in results['cases'].items():
+        old_case = baseline.get('cases', {}).get(key)
+        if not old_case:
+            continue
+        for stage, current in case['stages'].items():
+            previous = old_case['stages'].get(stage)
+            if not previous:
+                continue
+            noise = max(min_delta, previous.get('spread_seconds', 0.0), current.get('spread_seconds', 0.0))
+            if current['seconds'] > previous['seconds'] * (1 + tolerance) + noise:
+                regressions.append(f"{key} {stage}: {previous['seconds']:.4f}s -> {current['seconds']:.4f}s")
+        current = case.get('end_to_end')
+        previous = old_case.get('end_to_end')
+        if current and previous and current['peak_mb'] > previous['peak_mb'] * (1 + tolerance):
+            regressions.append(f"{key} peak memory: {previous['peak_mb']} MB -> {current['peak_mb']} MB")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every PasswordGenerator stage.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=gvdilix.SIZE_PRESETS,
+                        help="Target counts (default: the 1k-1M menu presets)")
+    parser.add_argument('--profiles', nargs='+', default=list(synthetic_profiles()),
+                        choices=list(synthetic_profiles()), help="Synthetic profiles to run")
+    parser.add_argument('--seed', type=int, default=1337, help="Generator seed")
+    parser.add_argument('--output', default="bench_output.txt", help="Scratch file for the writer benchmark")
+    parser.add_argument('--no-memory', action='store_true', help="Skip the tracemalloc end-to-end pass")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="Runs per measurement, the fastest is kept (default 5)")
+    parser.add_argument('--save', metavar='JSON', help="Write results as a new baseline")
+    parser.add_argument('--compare', metavar='JSON', help="Fail if slower than this baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Allowed slowdown/growth before flagging a regression (default 0.25)")
+    parser.add_argument('--min-delta', type=float, default=0.005,
+                        help="Seconds a stage may always slow down by, on top of the tolerance (default 0.005)")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.profiles, args.seed, args.output, not args.no_memory, max(1, args.repeat))
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"[+] Baseline saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance, args.min_delta)
+        if regressions:
+            print(f"[!] {len(regressions)} regression(s) against {args.compare}:")
+            for regression in regressions:
+                print(f"    {regression}")
+            return 1
+        print(f"[✓] No regressions against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,17 +4,134 @@
 #   Professional Wordlist Generator (EXACT COUNT)
 # ==============================================
 
+import argparse
+import bz2
+import cProfile
+import gzip
+import lzma
 import os
 import random
+import re
 import string
 import time
-import glob
+import hashlib
+import heapq
+import json
+import bisect
+import math
+import mmap
+import struct
+import sys
+import tempfile
+import threading
+import tracemalloc
+import zlib
+from array import array
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, chain, combinations, groupby, islice, permutations, product, takewhile
+from operator import itemgetter
+from queue import Queue
+
+try:
+    import numpy as np
+except ImportError:  # Optional: the mask engine falls back to pure Python
+    np = None
+
+# Wordlist sizes offered by the interactive menu
+SIZE_PRESETS = [1000, 10000, 25000, 50000, 100000, 250000, 500000, 1000000]
+
+# Letters substituted at once by the leet engine (None = every letter)
+LEET_MAX_DEPTH = 2
+
+# Likelihood weights of profile fields; candidate scores build on these
+FIELD_WEIGHTS = {
+    'name': 10, 'nick': 10, 'birth': 9, 'surname': 8, 'spouse': 8, 'child': 8, 'pet': 8,
+    'team': 7, 'favorite': 7, 'player': 6, 'anniversary': 6, 'phone': 6,
+    'mother': 5, 'father': 5, 'city': 5, 'hobby': 5, 'sport': 5,
+}
+DEFAULT_FIELD_WEIGHT = 4
+STAGE3_SCORE = 1
+RANDOM_SCORE = 0
+
+# Candidates held in memory by the ranked ordering before spilling to disk
+RANK_SPILL_LINES = 200000
+
+# Combinator defaults: separators, tokens per combination, words considered (None = all)
+COMBO_SEPARATORS = ['', '_', '-', '.', '@']
+COMBO_DEPTH = 2
+COMBO_WORDS = 20
+
+# Stage 3 sampling reservoir size used when streaming to disk
+STREAM_POOL_SIZE = 100000
+
+# Writer batching: lines encoded per writelines() call and file buffer size
+WRITE_BATCH_LINES = 8192
+WRITE_BUFFER_SIZE = 1 << 20
+# Encoded blocks queued between the generator and the pipelined writer thread
+WRITE_QUEUE_BLOCKS = 16
+
+# Compression choices and the extension appended to '.txt'
+COMPRESSION_EXTENSIONS = {'gzip': '.gz', 'bz2': '.bz2', 'lzma': '.xz'}
+
+# Per-folder metadata cache used by the wordlist viewer
+MANIFEST_NAME = "manifest.json"
+
+# Lines between offsets recorded in a wordlist's .idx sidecar
+INDEX_STRIDE = 64
+
+# Mask placeholders (?l ?u ?d ?s ?a); ?1-?4 are user charsets and ?w the profile words
+MASK_CHARSETS = {
+    'l': string.ascii_lowercase,
+    'u': string.ascii_uppercase,
+    'd': string.digits,
+    's': ' ' + string.punctuation,
+}
+MASK_CHARSETS['a'] = ''.join(MASK_CHARSETS.values())
+# Candidates built per NumPy block by the mask engine and the random fills
+MASK_BATCH = 1 << 16
+
+# Derived-token cache: folder, entries kept (LRU) and largest base list stored
+TOKEN_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'gvdilix')
+TOKEN_CACHE_ENTRIES = 64
+TOKEN_CACHE_MAX_BASE = 500000
+
+# External merge: lines sorted in memory per spill file, spill files merged at once
+MERGE_CHUNK_LINES = 1000000
+MERGE_FAN_IN = 64
+
+# Front-coded binary wordlists: lines per block and zlib level of each block (0 = stored)
+FRONT_CODED_EXTENSION = '.gvfc'
+FRONT_CODED_BLOCK_LINES = 256
+FRONT_CODED_LEVEL = 6
+
+# Prefix matches printed per query by the 'lookup' command
+LOOKUP_PREFIX_LIMIT = 20
+
+# Character classes a password policy can require, and the alphabet its random fill uses
+POLICY_CLASSES = {
+    'lower': string.ascii_lowercase,
+    'upper': string.ascii_uppercase,
+    'digit': string.digits,
+    'symbol': ' ' + string.punctuation,
+}
+POLICY_FILL_CHARS = string.ascii_letters + string.digits + '!@#$%^&*-_+='
+# Consecutive policy rejections of random fills before giving up on the exact count
+POLICY_MAX_REJECTS = 100000
+
+# Lines between checkpoints of a file being generated ('<file>.ckpt')
+CHECKPOINT_LINES = 100000
+
+# Top-up rounds the parallel merge may request before falling back to random fill
+PARALLEL_MAX_ROUNDS = 5
+# Accepted candidates handed to each worker as mutation seeds in top-up rounds
+PARALLEL_SEED_SIZE = 10000
 
 
 # ==========[ UI BANNER ]==========
-def banner():
-    os.system('cls' if os.name == 'nt' else 'clear')
+def banner(clear=True):
+    if clear:
+        os.system('cls' if os.name == 'nt' else 'clear')
     print("""
 ╔══════════════════════════════════════════════════════════╗
 ║        🔥 G V D I L I X   W O R D F O R G E 🔥          ║
@@ -26,395 +143,1879 @@ def banner():
 
 # ==========[ VIEW WORDLISTS ]==========
 def view_wordlists():
-    banner()
-    print("📁 WORDLIST VIEWER\n")
-
+    """File list loop; returns to the caller (main menu) when the user is done"""
     folder = "GVDILIX_OUTPUT"
 
-    # Check if folder exists
-    if not os.path.exists(folder):
-        print(f"[!] Folder '{folder}' doesn't exist yet.")
-        print(f"[!] Generate some wordlists first!")
-        input("\nPress Enter to continue...")
-        return
-
-    # Get all text files in the folder
-    files = glob.glob(f"{folder}/*.txt")
+    while True:
+        banner()
+        print("📁 WORDLIST VIEWER\n")
 
-    if not files:
-        print(f"[!] No wordlist files found in '{folder}'.")
-        print(f"[!] Generate some wordlists first!")
-        input("\nPress Enter to continue...")
-        return
+        # Check if folder exists
+        if not os.path.exists(folder):
+            print(f"[!] Folder '{folder}' doesn't exist yet.")
+            print(f"[!] Generate some wordlists first!")
+            input("\nPress Enter to continue...")
+            return
 
-    print(f"Found {len(files)} wordlist(s):\n")
+        # One directory scan, metadata from the manifest
+        files = scan_wordlists(folder)
 
-    # Display files with numbers
-    for i, filepath in enumerate(sorted(files, key=os.path.getmtime, reverse=True), 1):
-        filename = os.path.basename(filepath)
-        size = os.path.getsize(filepath)
-        line_count = 0
+        if not files:
+            print(f"[!] No wordlist files found in '{folder}'.")
+            print(f"[!] Generate some wordlists first!")
+            input("\nPress Enter to continue...")
+            return
 
-        # Count lines quickly
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                line_count = sum(1 for _ in f)
-        except:
-            line_count = "Unknown"
+        print(f"Found {len(files)} wordlist(s):\n")
 
-        modified = time.strftime('%Y-%m-%d %H:%M', time.localtime(os.path.getmtime(filepath)))
+        # Display files with numbers
+        for i, (filepath, meta) in enumerate(files, 1):
+            filename = os.path.basename(filepath)
+            line_count = f"{meta['lines']:,}" if isinstance(meta['lines'], int) else "Unknown"
+            modified = time.strftime('%Y-%m-%d %H:%M', time.localtime(meta['mtime_ns'] / 1e9))
 
-        print(f"  {i:2}. {filename}")
-        print(f"      Size: {size:,} bytes | Lines: {line_count:,}")
-        print(f"      Modified: {modified}")
-        print()
+            print(f"  {i:2}. {filename}")
+            print(f"      Size: {meta['size']:,} bytes | Lines: {line_count}")
+            print(f"      Modified: {modified}")
+            profile = meta.get('profile') or {}
+            if profile.get('name') or profile.get('surname'):
+                print(f"      Target: {profile.get('name', '')} {profile.get('surname', '')}".rstrip())
+            print()
 
-    # Let user choose a file
-    while True:
-        try:
-            choice = input(f"\nEnter file number to view (1-{len(files)}) or 'b' to go back: ").strip().lower()
+        # Let user choose a file
+        while True:
+            choice = input(f"\nEnter file number to view (1-{len(files)}), 'm' to merge or 'b' to go back: ").strip().lower()
 
             if choice == 'b':
                 return
-
-            choice_num = int(choice)
-            if 1 <= choice_num <= len(files):
-                selected_file = sorted(files, key=os.path.getmtime, reverse=True)[choice_num - 1]
-                view_file_contents(selected_file)
+            if choice == 'm':
+                merge_from_viewer(folder, files)
                 break
-            else:
+            if choice.isdigit() and 1 <= int(choice) <= len(files):
+                if view_file_contents(files[int(choice) - 1][0]):
+                    return
+                break
+            if choice.isdigit():
                 print(f"[!] Please enter a number between 1 and {len(files)}")
-        except ValueError:
-            print("[!] Please enter a valid number or 'b' to go back")
+            else:
+                print("[!] Please enter a valid number or 'b' to go back")
+
+
+def merge_from_viewer(folder, files):
+    """Pick listed wordlists and deduplicate them into a new file"""
+    picks = input("Files to merge (e.g. 1,3,4 or 'all'): ").strip().lower()
+    if picks == 'all':
+        selected = [path for path, _ in files]
+    else:
+        numbers = [int(part) for part in picks.replace(' ', '').split(',') if part.isdigit()]
+        selected = [files[number - 1][0] for number in dict.fromkeys(numbers) if 1 <= number <= len(files)]
+    if len(selected) < 2:
+        print("[!] Pick at least two files to merge")
+        input("\nPress Enter to continue...")
+        return
+    first_seen = input("Order (sorted/first-seen, Enter = sorted): ").strip().lower() == 'first-seen'
+    output = os.path.join(folder, f"merged_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
+
+    print(f"\n[+] Merging {len(selected)} files into {output}...")
+    start_time = time.time()
+    try:
+        written = merge_wordlists(selected, output, first_seen)
+        record_wordlist(output, written, None, {"mode": "merge", "sources": [os.path.basename(path) for path in selected],
+                                                "order": 'first-seen' if first_seen else 'sorted'})
+        print(f"[✓] {written:,} unique passwords in {time.time() - start_time:.2f}s")
+    except OSError as e:
+        print(f"[!] Error merging files: {e}")
+    input("\nPress Enter to continue...")
 
 
 def view_file_contents(filepath):
-    """Display contents of a wordlist file"""
-    banner()
+    """Display contents of a wordlist file, return True to go straight to the main menu"""
     filename = os.path.basename(filepath)
-    size = os.path.getsize(filepath)
-
-    print(f"📄 VIEWING: {filename}\n")
-    print(f"File: {filepath}")
-    print(f"Size: {size:,} bytes")
+    try:
+        pager = open_pager(filepath)
+    except (OSError, ValueError, EOFError, lzma.LZMAError) as e:
+        print(f"[!] Error reading file: {e}")
+        input("\nPress Enter to continue...")
+        return False
 
-    # Count lines
-    line_count = 0
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            for line_count, _ in enumerate(f, 1):
-                pass
-    except:
-        line_count = "Unknown"
+        while True:
+            banner()
+            print(f"📄 VIEWING: {filename}\n")
+            print(f"File: {filepath}")
+            print(f"Size: {os.path.getsize(filepath):,} bytes")
+            print(f"Lines: {pager.line_count:,}")
+            print("-" * 50)
+
+            # Ask how many lines to display
+            print("\nHow many lines would you like to see?")
+            print("  1) Pages of 10 lines")
+            print("  2) Pages of 50 lines")
+            print("  3) Pages of 100 lines")
+            print("  4) Pages of 500 lines")
+            print("  5) View all lines (may be slow for large files)")
+            print("  6) Random sample of lines")
+            print("  7) Go back")
+
+            view_choice = input("\nChoose option (1-7): ").strip()
+
+            if view_choice == '7':
+                return False
+
+            try:
+                page_sizes = {'1': 10, '2': 50, '3': 100, '4': 500}
+                if view_choice == '5':
+                    print(f"\nALL lines of {filename} (this may take a moment):\n")
+                    for i, line in enumerate(pager.iter_lines(), 1):
+                        print(f"{i:6}. {line}")
+                elif view_choice == '6':
+                    # Constant-memory sampling: seek to random lines through the index
+                    size_input = input("Sample size (Enter = 20): ").strip()
+                    sample_size = int(size_input) if size_input.isdigit() and int(size_input) > 0 else 20
+                    lines = pager.sample_lines(sample_size)
+                    if len(lines) < pager.line_count:
+                        print(f"\nRandom {len(lines)} lines from {filename}:\n")
+                    else:
+                        print(f"\nAll {len(lines)} lines from {filename}:\n")
+                    for i, line in enumerate(lines, 1):
+                        print(f"{i:6}. {line}")
+                else:
+                    if view_choice not in page_sizes:
+                        print("[!] Invalid choice. Showing pages of 10 lines.")
+                    pager.page_lines = page_sizes.get(view_choice, 10)
+                    pager.goto(0)
+                    browse_pages(pager, filename)
+            except Exception as e:
+                print(f"[!] Error reading file: {e}")
+
+            print("\n" + "=" * 50)
+
+            # File operations menu
+            print("\n📋 FILE OPERATIONS:")
+            print("  1) View more lines")
+            print("  2) Copy file path to clipboard (if supported)")
+            print("  3) Delete this file")
+            print("  4) Back to file list")
+            print("  5) Main menu")
+
+            op_choice = input("\nChoose option (1-5): ").strip()
+
+            if op_choice == '2':
+                try:
+                    # Try to copy to clipboard
+                    import pyperclip
+                    pyperclip.copy(filepath)
+                    print(f"[✓] File path copied to clipboard: {filepath}")
+                except:
+                    print(f"[!] Cannot copy to clipboard. Manual path: {filepath}")
+                input("\nPress Enter to continue...")
+            elif op_choice == '3':
+                confirm = input(f"\n⚠️  DELETE '{filename}'? This cannot be undone! (y/N): ").strip().lower()
+                if confirm == 'y':
+                    pager.close()
+                    try:
+                        delete_wordlist(filepath)
+                        print(f"[✓] File '{filename}' deleted successfully!")
+                    except Exception as e:
+                        print(f"[!] Error deleting file: {e}")
+                    input("\nPress Enter to continue...")
+                    return False
+            elif op_choice == '4':
+                return False
+            elif op_choice == '5':
+                return True
+    finally:
+        pager.close()
+
+
+def browse_pages(pager, filename):
+    """Interactive page loop: next/previous page, jump to a line or a percentage"""
+    while True:
+        lines = pager.page()
+        if not lines:
+            print(f"\n[!] {filename} is empty")
+            return
+        first = pager.line + 1
+        print(f"\nLines {first:,}-{first + len(lines) - 1:,} of {pager.line_count:,} "
+              f"({100 * (first + len(lines) - 1) / pager.line_count:.1f}%) of {filename}:\n")
+        for i, line in enumerate(lines, first):
+            print(f"{i:6}. {line}")
+
+        command = input("\n[Enter/n] next  [p] previous  [g] go to line  [%] go to percent  [q] quit: ").strip().lower()
+        if command in ('', 'n'):
+            if not pager.next():
+                print("[!] Already at the last page")
+        elif command == 'p':
+            if not pager.prev():
+                print("[!] Already at the first page")
+        elif command.startswith('g'):
+            target = command[1:].strip() or input(f"Line number (1-{pager.line_count}): ").strip()
+            if target.isdigit():
+                pager.goto(int(target) - 1)
+            else:
+                print("[!] Please enter a valid line number")
+        elif command.startswith('%'):
+            target = command[1:].strip() or input("Percent (0-100): ").strip()
+            try:
+                pager.goto_percent(float(target))
+            except ValueError:
+                print("[!] Please enter a valid percentage")
+        elif command == 'q':
+            return
+
+
+# ==========[ L33T TRANSFORMATIONS ]==========
+# Basic leet substitutions
+LEET_MAP = {
+    'a': ['@', '4'],
+    'e': ['3', '€'],
+    'i': ['1', '!'],
+    'o': ['0'],
+    's': ['5', '$'],
+    't': ['7'],
+    'l': ['1'],
+    'g': ['9'],
+    'b': ['8'],
+    'z': ['2']
+}
+
+
+class LeetEngine:
+    """Exhaustive, deterministic leet enumeration built on str.translate().
+
+    The substitutable letters of a word are combined 1..max_depth at a time and
+    every replacement choice is applied to all occurrences (either case) in a
+    single translate() call. Translation tables are compiled once per
+    combination and cached. budgets caps how many replacements of a letter
+    are tried, 0 disables the letter.
+    """
+
+    def __init__(self, leet_map=None, max_depth=LEET_MAX_DEPTH, budgets=None):
+        self.max_depth = max_depth
+        budgets = budgets or {}
+        self.substitutions = {}
+        for char, replacements in (leet_map or LEET_MAP).items():
+            limit = budgets.get(char, len(replacements))
+            if limit > 0:
+                self.substitutions[char] = tuple(replacements[:limit])
+        self._tables = {}
+
+    def _table(self, choice):
+        """Cached translate table for a tuple of (letter, replacement) pairs"""
+        table = self._tables.get(choice)
+        if table is None:
+            mapping = {}
+            for char, replacement in choice:
+                mapping[char] = replacement
+                mapping[char.upper()] = replacement
+            table = self._tables[choice] = str.maketrans(mapping)
+        return table
+
+    def choices(self, letters):
+        """Yield every (letter, replacement) combination over letters, shallowest first"""
+        depth_limit = len(letters) if self.max_depth is None else min(self.max_depth, len(letters))
+        for depth in range(1, depth_limit + 1):
+            for chars in combinations(letters, depth):
+                for replacements in product(*(self.substitutions[char] for char in chars)):
+                    yield tuple(zip(chars, replacements))
+
+    def count(self, word):
+        """Number of leet combinations choices() would try for word, without building them"""
+        letters = sorted({char.lower() for char in word} & self.substitutions.keys())
+        depth_limit = len(letters) if self.max_depth is None else min(self.max_depth, len(letters))
+        # Elementary symmetric sums of the per-letter option counts
+        sums = [1] + [0] * depth_limit
+        for char in letters:
+            options = len(self.substitutions[char])
+            for depth in range(depth_limit, 0, -1):
+                sums[depth] += sums[depth - 1] * options
+        return sum(sums[1:])
+
+    def variations(self, word):
+        """Lazily yield every distinct leet form of word (not word itself), shallowest first"""
+        letters = sorted({char.lower() for char in word} & self.substitutions.keys())
+        seen = {word}
+        for choice in self.choices(letters):
+            leet_word = word.translate(self._table(choice))
+            if leet_word not in seen:
+                seen.add(leet_word)
+                yield leet_word
+
+
+DEFAULT_LEET_ENGINE = LeetEngine()
+
+
+def get_leet_variations(word, engine=None):
+    variations = []
+    if not word:
+        return variations
+
+    # Add original word
+    variations.append(word)
+    variations.append(word.lower())
+    variations.append(word.upper())
+    variations.append(word.capitalize())
+
+    # Every leet form up to the engine's depth
+    variations.extend((engine or DEFAULT_LEET_ENGINE).variations(word.lower()))
+
+    return variations
 
-    print(f"Lines: {line_count:,}")
+
+# ==========[ DEDUP BACKENDS ]==========
+def fingerprint64(candidate):
+    """Stable 64-bit fingerprint of a candidate (never 0, which marks empty slots)"""
+    digest = hashlib.blake2b(candidate.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') or 1
+
+
+class SetDedup:
+    """Exact dedup through a Python set of str (fast, ~60-80 bytes per entry)"""
+
+    def __init__(self, expected=0):
+        self.seen = set()
+
+    def add(self, candidate):
+        """Record a candidate, return True if it was not seen before"""
+        if candidate in self.seen:
+            return False
+        self.seen.add(candidate)
+        return True
+
+    def __contains__(self, candidate):
+        return candidate in self.seen
+
+    def __len__(self):
+        return len(self.seen)
+
+
+class FingerprintDedup:
+    """Compact exact dedup: open-addressing table of 64-bit fingerprints.
+
+    Slots live in an array('Q') (8 bytes each) probed linearly. Two distinct
+    candidates only clash if their 64-bit fingerprints collide, which is
+    negligible below billions of entries.
+    """
+
+    MAX_LOAD = 0.85
+
+    def __init__(self, expected=0):
+        self.count = 0
+        self.slots = array('Q', bytes(8 * max(1024, int(expected / self.MAX_LOAD) + 1)))
+
+    def add(self, candidate):
+        """Record a candidate, return True if it was not seen before"""
+        if not self._insert(fingerprint64(candidate)):
+            return False
+        self.count += 1
+        if self.count > len(self.slots) * self.MAX_LOAD:
+            self._grow()
+        return True
+
+    def _insert(self, fingerprint):
+        slots = self.slots
+        size = len(slots)
+        idx = fingerprint % size
+        while True:
+            current = slots[idx]
+            if current == 0:
+                slots[idx] = fingerprint
+                return True
+            if current == fingerprint:
+                return False
+            idx += 1
+            if idx == size:
+                idx = 0
+
+    def _grow(self):
+        old_slots = self.slots
+        self.slots = array('Q', bytes(8 * len(old_slots) * 2))
+        for fingerprint in old_slots:
+            if fingerprint:
+                self._insert(fingerprint)
+
+    def __contains__(self, candidate):
+        fingerprint = fingerprint64(candidate)
+        slots = self.slots
+        idx = fingerprint % len(slots)
+        while slots[idx]:
+            if slots[idx] == fingerprint:
+                return True
+            idx = (idx + 1) % len(slots)
+        return False
+
+    def __len__(self):
+        return self.count
+
+
+class BloomDedup:
+    """Probabilistic dedup through a Bloom filter sized for a false-positive rate.
+
+    Never lets a duplicate through; a false positive only drops a candidate
+    that was actually new, so generation simply produces a replacement.
+    Uses about 1.44 * log2(1 / fp_rate) bits per expected entry.
+    """
+
+    def __init__(self, expected=0, fp_rate=0.001):
+        expected = max(expected, 1024)
+        self.size = max(64, int(-expected * math.log(fp_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / expected * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, candidate):
+        digest = hashlib.blake2b(candidate.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, candidate):
+        """Record a candidate, return True if it was (probably) not seen before"""
+        bits = self.bits
+        new = False
+        for pos in self._positions(candidate):
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                bits[pos >> 3] |= mask
+                new = True
+        if new:
+            self.count += 1
+        return new
+
+    def __contains__(self, candidate):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(candidate))
+
+    def __len__(self):
+        return self.count
+
+
+DEDUP_BACKENDS = {
+    'set': SetDedup,
+    'compact': FingerprintDedup,
+    'bloom': BloomDedup,
+}
+
+
+def make_dedup(kind='set', expected=0, fp_rate=0.001):
+    """Build a dedup backend by name, presized for the expected entry count"""
+    if kind not in DEDUP_BACKENDS:
+        raise ValueError(f"Unknown dedup backend '{kind}' (choose from {', '.join(DEDUP_BACKENDS)})")
+    if kind == 'bloom':
+        if not 0 < fp_rate < 1:
+            raise ValueError(f"Bloom false-positive rate must be between 0 and 1, got {fp_rate}")
+        return BloomDedup(expected, fp_rate)
+    return DEDUP_BACKENDS[kind](expected)
+
+
+# ==========[ KEYSPACE ESTIMATION ]==========
+class HyperLogLog:
+    """Distinct-count estimator in 2**precision bytes (~0.8% error at precision 14)"""
+
+    def __init__(self, precision=14):
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(self.size)
+
+    def add(self, candidate):
+        hashed = fingerprint64(candidate)
+        index = hashed & (self.size - 1)
+        rest = hashed >> self.precision
+        # Position of the lowest set bit in the remaining 64 - p bits
+        rank = (rest & -rest).bit_length() if rest else 64 - self.precision + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, candidates):
+        for candidate in candidates:
+            self.add(candidate)
+
+    def merge(self, other):
+        self.registers = bytearray(max(a, b) for a, b in zip(self.registers, other.registers))
+
+    def __len__(self):
+        alpha = 0.7213 / (1 + 1.079 / self.size)
+        estimate = alpha * self.size ** 2 / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * self.size and zeros:
+            # Small range: linear counting is more accurate
+            estimate = self.size * math.log(self.size / zeros)
+        return int(round(estimate))
+
+
+def print_keyspace(estimate):
+    """Human-readable dry-run report for PasswordGenerator.estimate_keyspace()"""
+    print("\n📐 KEYSPACE ESTIMATE (dry run, nothing written)")
     print("-" * 50)
+    print(f"  Profile words      : {estimate['words']:,}")
+    print(f"  Base combinations  : {estimate['base']['raw']:,} raw | ≈ {estimate['base']['distinct']:,} distinct")
+    print(f"  Stage 1 leet       : {estimate['leet']['raw']:,} raw | ≈ {estimate['leet']['distinct']:,} distinct")
+    print(f"  Stage 2 symbols    : ≈ {estimate['symbols']['distinct']:,}")
+    print(f"  Profile keyspace   : ≈ {estimate['total']:,} distinct candidates")
+    print(f"\n[+] Targets above ~{estimate['total']:,} are padded by Stage 3 random mutations.")
+
+
+# ==========[ CANDIDATE POOL ]==========
+class CandidatePool:
+    """Deduplicated candidate store with O(1) inserts and O(1) uniform sampling.
+
+    A dedup backend answers "seen before?" while a parallel list allows
+    random.choice() without copying the whole collection. With a capacity the
+    list becomes a reservoir: a uniform sample of everything accepted, of
+    bounded size.
+    """
+
+    def __init__(self, candidates=(), capacity=None, rng=random, dedup=None):
+        self.items = []
+        self.attempts = 0
+        self.seen = dedup if dedup is not None else SetDedup()
+        self.capacity = capacity
+        self.rng = rng
+        for candidate in candidates:
+            self.add(candidate)
+
+    def add(self, candidate):
+        """Add a candidate, return True if it was not already in the pool"""
+        self.attempts += 1
+        if not self.seen.add(candidate):
+            return False
+        if self.capacity is None or len(self.items) < self.capacity:
+            self.items.append(candidate)
+        else:
+            # Reservoir sampling keeps every accepted candidate equally likely
+            slot = self.rng.randrange(len(self.seen))
+            if slot < self.capacity:
+                self.items[slot] = candidate
+        return True
+
+    def sample(self):
+        """Return a uniformly random candidate from the pool"""
+        return self.rng.choice(self.items)
+
+    def __contains__(self, candidate):
+        return candidate in self.seen
+
+    def __len__(self):
+        return len(self.seen)
+
+
+# ==========[ LINE INDEX ]==========
+class LineIndex:
+    """Sparse binary line-offset index stored next to a wordlist as '<file>.idx'.
+
+    Every INDEX_STRIDE-th line start is kept as a 64-bit offset, so the index
+    costs ~1/8 byte per line. Line count is O(1) and reaching line N is one
+    seek plus at most INDEX_STRIDE - 1 skipped lines. The header records the
+    wordlist size and mtime; a stale index is rebuilt on open.
+    """
+
+    MAGIC = b'GVIX'
+    HEADER = struct.Struct('<4sIQQq')  # magic, stride, line count, file size, mtime_ns
+
+    def __init__(self, path, stride, line_count, offsets):
+        self.path = path
+        self.stride = stride
+        self.line_count = line_count
+        self.offsets = offsets
+
+    @staticmethod
+    def index_path(path):
+        return f"{path}.idx"
+
+    @classmethod
+    def build(cls, path, stride=None):
+        """Scan a wordlist once and record the start of every stride-th line"""
+        stride = stride or INDEX_STRIDE
+        offsets = array('Q')
+        line_count = 0
+        position = 0
+        with open_wordlist(path) as f:
+            for line in f:
+                if line_count % stride == 0:
+                    offsets.append(position)
+                line_count += 1
+                position += len(line)
+        return cls(path, stride, line_count, offsets)
+
+    @classmethod
+    def load(cls, path):
+        """Read the sidecar index, return None if missing or stale"""
+        try:
+            stat = os.stat(path)
+            with open(cls.index_path(path), 'rb') as f:
+                magic, stride, line_count, size, mtime_ns = cls.HEADER.unpack(f.read(cls.HEADER.size))
+                if magic != cls.MAGIC or size != stat.st_size or mtime_ns != stat.st_mtime_ns:
+                    return None
+                offsets = array('Q')
+                offsets.frombytes(f.read())
+        except (OSError, struct.error, ValueError):
+            return None
+        return cls(path, stride, line_count, offsets)
+
+    @classmethod
+    def open(cls, path):
+        """Load the cached index, building and saving it if needed"""
+        index = cls.load(path)
+        if index is None:
+            index = cls.build(path)
+            try:
+                index.save()
+            except OSError:
+                pass  # Read-only folder: the in-memory index still works
+        return index
+
+    def save(self):
+        stat = os.stat(self.path)
+        with open(self.index_path(self.path), 'wb') as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.stride, self.line_count, stat.st_size, stat.st_mtime_ns))
+            f.write(self.offsets.tobytes())
+
+    def data_size(self):
+        """Uncompressed length of the wordlist in bytes"""
+        if not self.line_count:
+            return 0
+        with open_wordlist(self.path) as f:
+            self.seek_line(f, self.line_count - 1)
+            f.readline()
+            return f.tell()
+
+    def seek_line(self, f, line_no):
+        """Position binary file f at the start of line line_no (0-based)"""
+        f.seek(self.offsets[line_no // self.stride])
+        for _ in range(line_no % self.stride):
+            f.readline()
+
+    def read_lines(self, start, count):
+        """Return up to count lines starting at line start (0-based)"""
+        if start >= self.line_count or count <= 0:
+            return []
+        lines = []
+        with open_wordlist(self.path) as f:
+            self.seek_line(f, start)
+            for _ in range(min(count, self.line_count - start)):
+                lines.append(f.readline().rstrip(b'\r\n').decode('utf-8', errors='replace'))
+        return lines
+
+    def sample_lines(self, k, rng=random):
+        """Uniform random sample of k lines (file order) without reading the file.
+
+        Only the k chosen line numbers are held in memory; each costs one
+        seek plus at most stride - 1 skipped lines.
+        """
+        lines = []
+        with open_wordlist(self.path) as f:
+            for line_no in sorted(rng.sample(range(self.line_count), min(k, self.line_count))):
+                self.seek_line(f, line_no)
+                lines.append(f.readline().rstrip(b'\r\n').decode('utf-8', errors='replace'))
+        return lines
+
+
+class WordlistPager:
+    """Page through a wordlist with one open handle and a byte cursor.
+
+    Next page continues from the offset where the current one stopped and
+    previous pages come back from the offsets of pages already shown, so
+    each page reads only the bytes it shows. Jumps to a line or percentage
+    go through the sparse LineIndex (one seek plus at most INDEX_STRIDE - 1
+    skipped lines). Compressed files work too, but seeking backwards in
+    them restarts decompression.
+    """
+
+    def __init__(self, path, page_lines=10):
+        self.index = LineIndex.open(path)
+        self.file = open_wordlist(path)
+        self.page_lines = page_lines
+        self.line = 0
+        self.offset = 0
+        self._next = None  # (line, offset) just past the current page, once read
+        self._history = []  # (line, offset) of the pages before this one
+
+    @property
+    def line_count(self):
+        return self.index.line_count
+
+    def page(self):
+        """Lines of the current page"""
+        self.file.seek(self.offset)
+        count = max(0, min(self.page_lines, self.line_count - self.line))
+        lines = [self.file.readline() for _ in range(count)]
+        self._next = (self.line + count, self.file.tell())
+        return [line.rstrip(b'\r\n').decode('utf-8', errors='replace') for line in lines]
+
+    def next(self):
+        """Advance one page, return False at the last page"""
+        if self._next is None:
+            self.page()
+        if self._next[0] >= self.line_count:
+            return False
+        self._history.append((self.line, self.offset))
+        self.line, self.offset = self._next
+        self._next = None
+        return True
+
+    def prev(self):
+        """Go back one page, return False at the first page"""
+        if self.line == 0:
+            return False
+        if self._history:
+            self.line, self.offset = self._history.pop()
+            self._next = None
+        else:
+            self.goto(self.line - self.page_lines)
+        return True
 
-    # Ask how many lines to display
-    print("\nHow many lines would you like to see?")
-    print("  1) First 10 lines")
-    print("  2) First 50 lines")
-    print("  3) First 100 lines")
-    print("  4) First 500 lines")
-    print("  5) View all lines (may be slow for large files)")
-    print("  6) Random sample of 20 lines")
-    print("  7) Go back")
+    def goto(self, line_no):
+        """Make line line_no (0-based, clamped) the first line of the page"""
+        self.line = max(0, min(line_no, self.line_count - 1))
+        if self.line_count:
+            self.index.seek_line(self.file, self.line)
+        self.offset = self.file.tell() if self.line_count else 0
+        self._next = None
+        self._history = []
 
-    view_choice = input("\nChoose option (1-7): ").strip()
+    def goto_percent(self, percent):
+        """Jump to the line percent (0-100) of the way through the file"""
+        self.goto(int(self.line_count * max(0.0, min(percent, 100.0)) / 100))
 
-    if view_choice == '7':
-        return
+    def sample_lines(self, k):
+        return self.index.sample_lines(k)
 
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = []
-
-            if view_choice == '1':
-                lines = [f.readline().strip() for _ in range(10) if f.readline()]
-                print(f"\nFirst 10 lines of {filename}:\n")
-            elif view_choice == '2':
-                lines = [f.readline().strip() for _ in range(50) if f.readline()]
-                print(f"\nFirst 50 lines of {filename}:\n")
-            elif view_choice == '3':
-                lines = [f.readline().strip() for _ in range(100) if f.readline()]
-                print(f"\nFirst 100 lines of {filename}:\n")
-            elif view_choice == '4':
-                lines = [f.readline().strip() for _ in range(500) if f.readline()]
-                print(f"\nFirst 500 lines of {filename}:\n")
-            elif view_choice == '5':
-                print(f"\nALL lines of {filename} (this may take a moment):\n")
-                lines = [line.strip() for line in f]
-            elif view_choice == '6':
-                # Read all lines first for random sampling
-                all_lines = [line.strip() for line in f]
-                if len(all_lines) > 20:
-                    lines = random.sample(all_lines, 20)
-                    print(f"\nRandom 20 lines from {filename}:\n")
-                else:
-                    lines = all_lines
-                    print(f"\nAll {len(lines)} lines from {filename}:\n")
-            else:
-                print("[!] Invalid choice. Showing first 10 lines.")
-                f.seek(0)
-                lines = [f.readline().strip() for _ in range(10) if f.readline()]
-                print(f"\nFirst 10 lines of {filename}:\n")
+    def iter_lines(self):
+        """Every line from the start, leaving the page cursor alone"""
+        self.file.seek(0)
+        for line in self.file:
+            yield line.rstrip(b'\r\n').decode('utf-8', errors='replace')
+        self.file.seek(self.offset)
 
-            # Display lines
-            for i, line in enumerate(lines, 1):
-                print(f"{i:6}. {line}")
+    def close(self):
+        self.file.close()
 
-            if view_choice != '5' and view_choice != '6' and len(lines) < line_count:
-                print(f"\n... and {line_count - len(lines):,} more lines!")
 
-    except Exception as e:
-        print(f"[!] Error reading file: {e}")
+class FrontCodedPager(WordlistPager):
+    """WordlistPager over a front-coded wordlist: a page decodes at most two blocks"""
 
-    print("\n" + "=" * 50)
+    def __init__(self, path, page_lines=10):
+        self.reader = FrontCodedWordlist(path)
+        self.page_lines = page_lines
+        self.line = 0
+
+    @property
+    def line_count(self):
+        return self.reader.line_count
+
+    def page(self):
+        return self.reader.read_lines(self.line, self.page_lines)
+
+    def next(self):
+        if self.line + self.page_lines >= self.line_count:
+            return False
+        self.line += self.page_lines
+        return True
+
+    def prev(self):
+        if self.line == 0:
+            return False
+        self.goto(self.line - self.page_lines)
+        return True
+
+    def goto(self, line_no):
+        self.line = max(0, min(line_no, self.line_count - 1))
 
-    # File operations menu
-    print("\n📋 FILE OPERATIONS:")
-    print("  1) View more lines")
-    print("  2) Copy file path to clipboard (if supported)")
-    print("  3) Delete this file")
-    print("  4) Back to file list")
-    print("  5) Main menu")
+    def sample_lines(self, k):
+        return self.reader.sample_lines(k)
 
-    op_choice = input("\nChoose option (1-5): ").strip()
+    def iter_lines(self):
+        return iter(self.reader)
 
-    if op_choice == '1':
-        view_file_contents(filepath)
-    elif op_choice == '2':
+    def close(self):
+        self.reader.close()
+
+
+def open_pager(path):
+    """Pager for any wordlist the viewer lists"""
+    return FrontCodedPager(path) if is_front_coded(path) else WordlistPager(path)
+
+
+# ==========[ MANIFEST ]==========
+def manifest_path(folder):
+    return os.path.join(folder, MANIFEST_NAME)
+
+
+def load_manifest(folder):
+    """Read a folder's manifest, return {} if it is missing or unreadable"""
+    try:
+        with open(manifest_path(folder), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def save_manifest(folder, manifest):
+    """Atomically replace a folder's manifest"""
+    tmp_path = manifest_path(folder) + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, manifest_path(folder))
+
+
+def record_wordlist(filepath, line_count, profile=None, params=None):
+    """Add or refresh the manifest entry of a freshly written wordlist"""
+    folder = os.path.dirname(filepath) or '.'
+    stat = os.stat(filepath)
+    manifest = load_manifest(folder)
+    manifest[os.path.basename(filepath)] = {
+        'lines': line_count,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'profile': profile,
+        'params': params,
+    }
+    save_manifest(folder, manifest)
+
+
+def delete_wordlist(filepath):
+    """Delete a wordlist with its line index, checkpoint and (for --rules output) rule file"""
+    meta = load_manifest(os.path.dirname(filepath) or '.').get(os.path.basename(filepath)) or {}
+    sidecars = [LineIndex.index_path(filepath), checkpoint_path(filepath)]
+    if (meta.get('params') or {}).get('mode') == 'rules':
+        sidecars.append(rules_path(filepath))
+    os.remove(filepath)
+    for path in sidecars:
+        if os.path.exists(path):
+            os.remove(path)
+    forget_wordlist(filepath)
+
+
+def forget_wordlist(filepath):
+    """Drop a deleted wordlist from its folder's manifest"""
+    folder = os.path.dirname(filepath) or '.'
+    manifest = load_manifest(folder)
+    if manifest.pop(os.path.basename(filepath), None) is not None:
+        save_manifest(folder, manifest)
+
+
+def scan_wordlists(folder):
+    """List (path, metadata) for every .txt wordlist, newest first.
+
+    Costs one directory scan: entries whose size and mtime still match the
+    manifest are trusted, anything new or changed is recounted through its
+    line index and written back.
+    """
+    manifest = load_manifest(folder)
+    changed = False
+    entries = []
+    with os.scandir(folder) as scan:
+        for entry in scan:
+            if not is_wordlist(entry.name) or not entry.is_file():
+                continue
+            stat = entry.stat()
+            meta = manifest.get(entry.name)
+            if not meta or meta.get('size') != stat.st_size or meta.get('mtime_ns') != stat.st_mtime_ns:
+                try:
+                    if is_front_coded(entry.name):
+                        with FrontCodedWordlist(entry.path) as reader:
+                            line_count = reader.line_count
+                    else:
+                        line_count = LineIndex.open(entry.path).line_count
+                except (OSError, ValueError, EOFError, lzma.LZMAError):
+                    line_count = None  # Unreadable or truncated: listed as "Unknown"
+                meta = {
+                    'lines': line_count,
+                    'size': stat.st_size,
+                    'mtime_ns': stat.st_mtime_ns,
+                    'profile': (meta or {}).get('profile'),
+                    'params': (meta or {}).get('params'),
+                }
+                manifest[entry.name] = meta
+                changed = True
+            entries.append((entry.path, meta))
+
+    # Forget files removed behind our back
+    present = {os.path.basename(path) for path, _ in entries}
+    for name in [name for name in manifest if name not in present]:
+        del manifest[name]
+        changed = True
+
+    if changed:
         try:
-            # Try to copy to clipboard
-            import pyperclip
-            pyperclip.copy(filepath)
-            print(f"[✓] File path copied to clipboard: {filepath}")
-        except:
-            print(f"[!] Cannot copy to clipboard. Manual path: {filepath}")
-        input("\nPress Enter to continue...")
-        view_file_contents(filepath)
-    elif op_choice == '3':
-        confirm = input(f"\n⚠️  DELETE '{filename}'? This cannot be undone! (y/N): ").strip().lower()
-        if confirm == 'y':
-            try:
-                os.remove(filepath)
-                print(f"[✓] File '{filename}' deleted successfully!")
-            except Exception as e:
-                print(f"[!] Error deleting file: {e}")
-            input("\nPress Enter to continue...")
-            view_wordlists()
+            save_manifest(folder, manifest)
+        except OSError:
+            pass  # Read-only folder: listing still works
+    entries.sort(key=lambda item: item[1]['mtime_ns'], reverse=True)
+    return entries
+
+
+# ==========[ WORDLIST WRITER ]==========
+def open_wordlist(path, mode='rb', **kwargs):
+    """Open a wordlist, transparently (de)compressing by file extension"""
+    if path.endswith('.gz'):
+        return gzip.open(path, mode, **kwargs)
+    if path.endswith('.bz2'):
+        return bz2.open(path, mode, **kwargs)
+    if path.endswith('.xz'):
+        return lzma.open(path, mode, **kwargs)
+    return open(path, mode, buffering=WRITE_BUFFER_SIZE, **kwargs)
+
+
+def is_wordlist(filename):
+    """True for plain, compressed or front-coded wordlists produced by the writer"""
+    return filename.endswith(('.txt', FRONT_CODED_EXTENSION)
+                             + tuple(f".txt{ext}" for ext in COMPRESSION_EXTENSIONS.values()))
+
+
+def is_front_coded(filename):
+    return filename.endswith(FRONT_CODED_EXTENSION)
+
+
+def write_wordlist(filename, passwords, append=False, checkpoint=None, pipelined=False):
+    """Write passwords to filename as they are produced, return the line count.
+
+    Lines are encoded and written in blocks of WRITE_BATCH_LINES. A '.gz',
+    '.bz2' or '.xz' extension selects compression and '-' streams to stdout.
+    For files, the sparse line index is collected while writing and saved as
+    a sidecar. pipelined=True hands the blocks to a writer thread.
+    """
+    blocks = _encode_batches(passwords)
+    if pipelined:
+        return write_blocks_pipelined(filename, blocks, append, checkpoint)
+    return write_blocks(filename, blocks, append, checkpoint)
+
+
+def _encode_batches(passwords):
+    """Group passwords into (bytes, line lengths) blocks for write_blocks()"""
+    passwords = iter(passwords)
+    while True:
+        batch = list(islice(passwords, WRITE_BATCH_LINES))
+        if not batch:
+            return
+        batch.append('')
+        data = '\n'.join(batch).encode('utf-8')
+        del batch[-1]
+        if len(data) == sum(map(len, batch)) + len(batch):
+            yield data, [len(line) + 1 for line in batch]  # ASCII: one byte per character
         else:
-            view_file_contents(filepath)
-    elif op_choice == '4':
-        view_wordlists()
-    elif op_choice == '5':
-        return
+            yield data, [len(line.encode('utf-8')) + 1 for line in batch]
 
 
-# ==========[ L33T TRANSFORMATIONS ]==========
-def get_leet_variations(word):
-    variations = []
-    if not word:
-        return variations
+def write_blocks_pipelined(filename, blocks, append=False, checkpoint=None, depth=WRITE_QUEUE_BLOCKS):
+    """write_blocks() on a writer thread fed through a bounded queue.
 
-    # Basic leet substitutions
-    leet_map = {
-        'a': ['@', '4'],
-        'e': ['3', '€'],
-        'i': ['1', '!'],
-        'o': ['0'],
-        's': ['5', '$'],
-        't': ['7'],
-        'l': ['1'],
-        'g': ['9'],
-        'b': ['8'],
-        'z': ['2']
-    }
+    The calling thread keeps generating and encoding while the writer
+    compresses, writes and checkpoints earlier blocks. File I/O and
+    zlib/bz2/lzma release the GIL, so wall time approaches
+    max(generate, write) instead of their sum. At most depth blocks are
+    in flight. A writer error (or a closed stdout) stops the producer and
+    the error is re-raised here.
+    """
+    queue = Queue(maxsize=depth)
+    state = {'stopped': False}
 
-    # Add original word
-    variations.append(word)
-    variations.append(word.lower())
-    variations.append(word.upper())
-    variations.append(word.capitalize())
+    def queued():
+        for block in iter(queue.get, None):
+            yield block
+        state['drained'] = True
 
-    # Generate leet variations
-    for i in range(min(3, len(word))):  # Generate 3 leet variations max
-        leet_word = list(word.lower())
-        # Replace 1-3 characters with leet
-        for _ in range(random.randint(1, 3)):
-            idx = random.randint(0, len(leet_word) - 1)
-            char = leet_word[idx]
-            if char in leet_map:
-                leet_word[idx] = random.choice(leet_map[char])
-        variations.append(''.join(leet_word))
+    def consume():
+        try:
+            state['count'] = write_blocks(filename, queued(), append, checkpoint)
+        except BaseException as e:
+            state['error'] = e
+        if 'drained' not in state:
+            # Stopped early: tell the producer and unblock its pending put()
+            state['stopped'] = True
+            for _ in iter(queue.get, None):
+                pass
 
-    return variations
+    writer = threading.Thread(target=consume, name='gvdilix-writer', daemon=True)
+    writer.start()
+    try:
+        for block in blocks:
+            if state['stopped']:
+                break
+            queue.put(block)
+    finally:
+        queue.put(None)
+        writer.join()
+    if 'error' in state:
+        raise state['error']
+    return state['count']
 
 
-# ==========[ PASSWORD GENERATOR ]==========
-class PasswordGenerator:
-    def __init__(self, user_data):
-        self.data = user_data
-        self.all_words = []
-        self.symbols = ['!', '@', '#', '$', '%', '^', '&', '*', '-', '_', '+', '=']
-        self.numbers = ['123', '1234', '12345', '123456', '111', '222', '333', '444', '555',
-                        '666', '777', '888', '999', '000', '1111', '2222', '3333', '2020',
-                        '2021', '2022', '2023', '2024', '2025']
+def _byte_batches(lines):
+    """Group byte lines (without line endings) into (bytes, line lengths) blocks"""
+    while True:
+        batch = list(islice(lines, WRITE_BATCH_LINES))
+        if not batch:
+            return
+        batch.append(b'')
+        yield b'\n'.join(batch), [len(line) + 1 for line in batch[:-1]]
 
-    def extract_words(self):
-        """Extract all possible words from user data"""
+
+def terminate_last_line(path):
+    """Add the newline a hand-made plain wordlist may lack after its last line.
+
+    Appending would otherwise glue the first new line onto it. Compressed
+    tails are left alone: there a missing newline marks a torn write.
+    """
+    if path.endswith(tuple(COMPRESSION_EXTENSIONS.values())):
+        return
+    with open(path, 'r+b') as f:
+        end = f.seek(0, os.SEEK_END)
+        if end:
+            f.seek(end - 1)
+            if f.read(1) != b'\n':
+                f.write(b'\n')
+
+
+def write_blocks(filename, blocks, append=False, checkpoint=None):
+    """Write pre-encoded (bytes, line lengths) blocks, return the line count.
+
+    Line lengths are a list, or one int when every line in the block has the
+    same width (mask output), which keeps index bookkeeping O(1) per block.
+    With append=True new lines go after an existing file's and the count
+    covers both. checkpoint(lines, size) is called after flushing every
+    CHECKPOINT_LINES lines, size being the uncompressed bytes written so far.
+    """
+    to_stdout = filename == '-'
+    count = 0
+    position = 0
+    offsets = array('Q')
+    if append and not to_stdout and os.path.exists(filename):
+        terminate_last_line(filename)
+        index = LineIndex.open(filename)
+        count, position, offsets = index.line_count, index.data_size(), index.offsets
+    next_checkpoint = count + CHECKPOINT_LINES
+    f = sys.stdout.buffer if to_stdout else open_wordlist(filename, 'ab' if append else 'wb')
+    try:
+        for data, lengths in blocks:
+            f.write(data)
+            # Start offset of every line in the block, then keep every stride-th
+            if isinstance(lengths, int):
+                lines = len(data) // lengths
+                starts = range(position, position + len(data), lengths)
+            else:
+                lines = len(lengths)
+                starts = list(accumulate(lengths, initial=position))[:-1]
+            offsets.extend(starts[(-count) % INDEX_STRIDE::INDEX_STRIDE])
+            position += len(data)
+            count += lines
+            if checkpoint is not None and count >= next_checkpoint:
+                f.flush()
+                checkpoint(count, position)
+                next_checkpoint = count + CHECKPOINT_LINES
+    except BrokenPipeError:
+        if not to_stdout:
+            raise
+        # The consumer (e.g. a cracker reading stdin) went away: stop quietly
+        # and point stdout at devnull so the interpreter's final flush succeeds
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return count
+    finally:
+        if not to_stdout:
+            f.close()
+    if to_stdout:
+        f.flush()
+    else:
+        LineIndex(filename, INDEX_STRIDE, count, offsets).save()
+    return count
+
+
+# ==========[ COMBINATOR ]==========
+class Combinator:
+    """Lazy N-way combinations of profile tokens joined by a separator.
+
+    Every ordered tuple of distinct tokens, 2..max_depth long, is visited
+    exactly once per separator, so no string is formatted twice. Tuples made
+    only of number tokens are skipped. Nothing is materialized; len() gives
+    the exact number of (tuple, separator) pairs.
+    """
+
+    def __init__(self, words, numbers=(), separators=None, max_depth=2):
+        self.words = list(dict.fromkeys(words))
+        self.numbers = [number for number in dict.fromkeys(numbers) if number not in self.words]
+        self.separators = list(COMBO_SEPARATORS if separators is None else separators)
+        self.max_depth = max_depth
+
+    def __iter__(self):
+        tokens = self.words + self.numbers
+        numbers = set(self.numbers)
+        for depth in range(2, min(self.max_depth, len(tokens)) + 1):
+            for parts in permutations(tokens, depth):
+                if all(part in numbers for part in parts):
+                    continue
+                for sep in self.separators:
+                    yield parts, sep
+
+    def __len__(self):
+        total_tokens = len(self.words) + len(self.numbers)
+        count = 0
+        for depth in range(2, min(self.max_depth, total_tokens) + 1):
+            count += math.perm(total_tokens, depth) - math.perm(len(self.numbers), depth)
+        return count * len(self.separators)
+
+
+# ==========[ MASK ENGINE ]==========
+class MaskEngine:
+    """Hashcat-style mask enumeration and sampling in NumPy blocks.
+
+    '?l', '?u', '?d', '?s' and '?a' expand to MASK_CHARSETS, '?1'-'?4' to
+    user charsets, '?w' to the profile words and '??' to a literal '?'. A
+    literal run that is exactly a profile field name (fields) expands to
+    that field's words, so 'name?d?d?d?d' is a hybrid mask.
+
+    Single-character positions vary fastest (odometer order, last position
+    first) and are built as uint8 matrices, MASK_BATCH rows at a time,
+    converted to newline-terminated bytes in one tobytes() call. Word
+    positions are enumerated around them. Without NumPy the same order is
+    produced with itertools.product.
+    """
+
+    def __init__(self, mask, words=(), fields=None, charsets=None):
+        self.mask = mask
+        self.charsets = dict(MASK_CHARSETS, **(charsets or {}))
+        self.positions = self._parse(mask, list(dict.fromkeys(words)), fields or {})
+
+    def _parse(self, mask, words, fields):
+        """List of alphabets (tuples of encoded tokens), one per mask position"""
+        positions = []
+        literal = []
+
+        def flush():
+            if literal:
+                text = ''.join(literal)
+                if text in fields:
+                    positions.append(tuple(dict.fromkeys(w.encode('utf-8') for w in fields[text])))
+                else:
+                    positions.extend((char.encode('utf-8'),) for char in text)
+                literal.clear()
+
+        chars = iter(mask)
+        for char in chars:
+            if char != '?':
+                literal.append(char)
+                continue
+            key = next(chars, None)
+            if key == '?':
+                literal.append('?')
+                continue
+            flush()
+            if key == 'w':
+                positions.append(tuple(w.encode('utf-8') for w in words))
+            elif key in self.charsets:
+                positions.append(tuple(dict.fromkeys(c.encode('utf-8') for c in self.charsets[key])))
+            else:
+                raise ValueError(f"Unknown mask placeholder '?{key or ''}' in '{mask}'")
+        flush()
+        if any(not alphabet for alphabet in positions):
+            raise ValueError(f"Mask '{mask}' has a position with nothing to expand")
+        return positions
+
+    def __len__(self):
+        return math.prod(len(alphabet) for alphabet in self.positions)
+
+    def _split(self):
+        """Indexes of the vectorizable single-byte positions and of the rest"""
+        inner = [i for i, alphabet in enumerate(self.positions)
+                 if len(alphabet) > 1 and all(len(token) == 1 for token in alphabet)]
+        outer = [i for i in range(len(self.positions)) if i not in inner]
+        return inner, outer
+
+    def _layout(self, fixed):
+        """Byte template for one assignment of the outer positions.
+
+        Returns (template, columns): the line with zero bytes in the inner
+        columns and a trailing newline, and the column of each inner position.
+        """
+        template = bytearray()
+        columns = []
+        for i, alphabet in enumerate(self.positions):
+            if i in fixed:
+                template += fixed[i]
+            else:
+                columns.append(len(template))
+                template.append(0)
+        template += b'\n'
+        return bytes(template), columns
+
+    def _assignments(self, outer):
+        for tokens in product(*(self.positions[i] for i in outer)):
+            yield dict(zip(outer, tokens))
+
+    def iter_blocks(self, batch=MASK_BATCH):
+        """Yield (newline-terminated bytes, line width) blocks of every candidate"""
+        inner, outer = self._split()
+        tables = [b''.join(self.positions[i]) for i in inner]
+        for fixed in self._assignments(outer):
+            template, columns = self._layout(fixed)
+            if np is None:
+                yield from self._python_blocks(template, columns, tables, batch)
+            else:
+                yield from self._numpy_blocks(template, columns, tables, batch)
+
+    @staticmethod
+    def _numpy_blocks(template, columns, tables, batch):
+        """Odometer blocks: the fastest columns are enumerated once into a
+        matrix that is copied per block with the slow columns stamped in"""
+        width = len(template)
+        low = len(tables)
+        rows = 1
+        while low > 0 and (rows * len(tables[low - 1]) <= batch or low == len(tables)):
+            low -= 1
+            rows *= len(tables[low])
+        # Last position is the least significant digit
+        index = np.arange(rows, dtype=np.int64)
+        pattern = np.tile(np.frombuffer(template, dtype=np.uint8), (rows, 1))
+        for column, table in zip(reversed(columns[low:]), reversed(tables[low:])):
+            index, digit = np.divmod(index, len(table))
+            pattern[:, column] = np.frombuffer(table, dtype=np.uint8)[digit]
+        if not low:
+            yield pattern.tobytes(), width
+            return
+        for high in product(*tables[:low]):
+            pattern[:, columns[:low]] = high
+            yield pattern.tobytes(), width
+
+    @staticmethod
+    def _python_blocks(template, columns, tables, batch):
+        """Pure-Python fallback for iter_blocks(), same order and block shape"""
+        pieces = []
+        previous = 0
+        for column in columns:
+            pieces.append(template[previous:column])
+            previous = column + 1
+        tail = template[previous:]
+        alphabets = [[bytes([byte]) for byte in table] for table in tables]
+        lines = (b''.join(chain.from_iterable(zip(pieces, combo))) + tail
+                 for combo in product(*alphabets))
+        while True:
+            block = b''.join(islice(lines, batch))
+            if not block:
+                return
+            yield block, len(template)
+
+    def __iter__(self):
+        for block, _ in self.iter_blocks():
+            yield from block.decode('utf-8').split('\n')[:-1]
+
+    def sample(self, count, rng=random):
+        """count uniformly random candidates (with replacement) as strings.
+
+        NumPy draws are seeded from rng, so a seeded rng stays reproducible.
+        """
+        inner, outer = self._split()
+        tables = [b''.join(self.positions[i]) for i in inner]
+        if np is None:
+            alphabets = [[token.decode('utf-8') for token in alphabet] for alphabet in self.positions]
+            return [''.join(rng.choice(alphabet) for alphabet in alphabets) for _ in range(count)]
+        generator = np.random.default_rng(rng.getrandbits(64))
+        assignments = [fixed for fixed in self._assignments(outer)] if outer else [{}]
+        picks = np.bincount(generator.integers(0, len(assignments), count), minlength=len(assignments))
+        samples = []
+        for fixed, rows in zip(assignments, picks.tolist()):
+            if not rows:
+                continue
+            template, columns = self._layout(fixed)
+            block = np.tile(np.frombuffer(template, dtype=np.uint8), (rows, 1))
+            for column, table in zip(columns, tables):
+                lookup = np.frombuffer(table, dtype=np.uint8)
+                block[:, column] = lookup[generator.integers(0, len(lookup), rows)]
+            samples.extend(block.tobytes().decode('utf-8').split('\n')[:-1])
+        if len(assignments) > 1:
+            rng.shuffle(samples)
+        return samples
+
+
+class RandomFill:
+    """Buffered random strings of one alphabet with lengths in [min_len, max_len].
+
+    Strings are drawn from a max_len mask in blocks that double up to
+    MASK_BATCH and are cut to a random length, replacing per-candidate
+    rng.choices() + join calls.
+    """
+
+    def __init__(self, alphabet, min_len, max_len, rng=random):
+        self.engine = MaskEngine('?1' * max_len, charsets={'1': alphabet})
+        self.min_len = min_len
+        self.max_len = max_len
+        self.rng = rng
+        self.batch = 1024
+        self.buffer = []
+
+    def refill(self):
+        if np is None:
+            lengths = [self.rng.randint(self.min_len, self.max_len) for _ in range(self.batch)]
+        else:
+            generator = np.random.default_rng(self.rng.getrandbits(64))
+            lengths = generator.integers(self.min_len, self.max_len + 1, self.batch).tolist()
+        self.buffer = [text[:length] for text, length in zip(self.engine.sample(self.batch, self.rng), lengths)]
+        self.buffer.reverse()
+        self.batch = min(self.batch * 2, MASK_BATCH)
+
+    def __call__(self):
+        if not self.buffer:
+            self.refill()
+        return self.buffer.pop()
+
+
+# ==========[ LIKELIHOOD RANKING ]==========
+class ScoreBuckets:
+    """Bucketed external ordering of (score, candidate) pairs.
+
+    Scores are small integers, so one bucket per score gives an exact
+    descending order. Buckets live in memory until RANK_SPILL_LINES
+    candidates are held, then every bucket is appended to its own temporary
+    file; memory stays bounded whatever the candidate count. Within a bucket
+    candidates keep their generation order.
+    """
+
+    def __init__(self, spill_lines=None):
+        self.spill_lines = spill_lines or RANK_SPILL_LINES
+        self.memory = {}
+        self.files = {}
+        self.held = 0
+
+    def add(self, score, candidate):
+        self.memory.setdefault(max(score, 0), []).append(candidate)
+        self.held += 1
+        if self.held >= self.spill_lines:
+            self.spill()
+
+    def spill(self):
+        for score, candidates in self.memory.items():
+            if score not in self.files:
+                self.files[score] = tempfile.TemporaryFile('w+', encoding='utf-8')
+            self.files[score].writelines(f"{candidate}\n" for candidate in candidates)
+        self.memory = {}
+        self.held = 0
+
+    def __iter__(self):
+        for score in sorted(set(self.memory) | set(self.files), reverse=True):
+            spill_file = self.files.get(score)
+            if spill_file is not None:
+                spill_file.seek(0)
+                for line in spill_file:
+                    yield line[:-1]
+            yield from self.memory.get(score, ())
+
+    def close(self):
+        for spill_file in self.files.values():
+            spill_file.close()
+        self.files = {}
+        self.memory = {}
+
+
+# ==========[ INSTRUMENTATION ]==========
+MUTATION_NAMES = {
+    0: 'random', 1: 'number', 2: 'symbol', 3: 'capitalize', 4: 'reverse',
+    5: 'double', 6: 'birth_year', 7: 'phone_digits', 8: 'suffix',
+}
+
+
+class GenerationStats:
+    """Per-stage instrumentation of a PasswordGenerator run.
+
+    For every stage it records wall and CPU time, candidates tried and
+    accepted (hence the duplicate-rejection rate) and, with trace_memory, the
+    tracemalloc peak. Stage 3 also gets a per-mutation-type breakdown.
+    profile_path dumps a cProfile of the Stage 3 hot loop. When streaming,
+    stage times include the time the consumer (e.g. the writer) spends
+    between candidates.
+    """
+
+    def __init__(self, trace_memory=False, profile_path=None):
+        self.trace_memory = trace_memory
+        self.profile_path = profile_path
+        self.profile_dumped = False
+        self.stages = {}
+        self.mutations = {}
+        self.notes = {}
+        self.current = None
+        self._profiler = None
+        self._started_tracing = False
+
+    def begin(self, stage, pool=None):
+        """Close the running stage and start timing the next one (None = done)"""
+        now_wall, now_cpu = time.perf_counter(), time.process_time()
+        attempts = pool.attempts if pool is not None else 0
+        accepted = len(pool) if pool is not None else 0
+
+        if self.current is not None:
+            name, wall, cpu, start_attempts, start_accepted = self.current
+            entry = self.stages.setdefault(name, {'wall_seconds': 0.0, 'cpu_seconds': 0.0,
+                                                  'attempts': 0, 'accepted': 0})
+            entry['wall_seconds'] += now_wall - wall
+            entry['cpu_seconds'] += now_cpu - cpu
+            if pool is not None:
+                entry['attempts'] += max(attempts - start_attempts, 0)
+                entry['accepted'] += max(accepted - start_accepted, 0)
+            if self.trace_memory:
+                entry['peak_bytes'] = max(entry.get('peak_bytes', 0), tracemalloc.get_traced_memory()[1])
+            if self._profiler is not None:
+                self._profiler.disable()
+                self._profiler.dump_stats(self.profile_path)
+                self._profiler = None
+                self.profile_dumped = True
+
+        if stage is None:
+            self.current = None
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+            return
+
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+        if stage == 'mutations' and self.profile_path:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self.current = (stage, time.perf_counter(), time.process_time(), attempts, accepted)
+
+    def mutation(self, kind, accepted):
+        """Count one Stage 3 attempt of a mutation type"""
+        entry = self.mutations.get(kind)
+        if entry is None:
+            entry = self.mutations[kind] = [0, 0]
+        entry[0] += 1
+        if accepted:
+            entry[1] += 1
+
+    def note(self, stage, **values):
+        self.notes.setdefault(stage, {}).update(values)
+
+    def report(self):
+        """Structured report: per-stage figures plus the mutation distribution"""
+        stages = {}
+        for name, entry in self.stages.items():
+            entry = dict(entry)
+            entry['duplicate_rate'] = (round(1 - entry['accepted'] / entry['attempts'], 4)
+                                       if entry['attempts'] else 0.0)
+            entry.update(self.notes.get(name, {}))
+            stages[name] = entry
+        total = sum(attempts for attempts, _ in self.mutations.values())
+        mutations = {
+            MUTATION_NAMES.get(kind, str(kind)): {
+                'attempts': attempts,
+                'accepted': accepted,
+                'share': round(attempts / total, 4) if total else 0.0,
+                'duplicate_rate': round(1 - accepted / attempts, 4) if attempts else 0.0,
+            }
+            for kind, (attempts, accepted) in sorted(self.mutations.items())
+        }
+        # Stage 3 may never run (small targets), then there is no profile to point at
+        return {'stages': stages, 'mutations': mutations,
+                'cprofile': self.profile_path if self.profile_dumped else None}
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+
+
+# ==========[ PASSWORD POLICY ]==========
+class PasswordPolicy:
+    """Compiled password policy, called on every candidate before it is kept.
+
+    Length bounds, a set of required character classes and/or a minimum
+    number of classes, a charset every character must belong to, and regex
+    rules: a candidate must match at least one allow pattern (if any) and
+    no deny pattern. Patterns are joined into one alternation each and the
+    class count is a single str.translate() plus a set, so a check costs a
+    handful of C calls. spec() round-trips through the constructor, so
+    policies travel to worker processes and checkpoints as plain dicts.
+    """
+
+    def __init__(self, min_length=0, max_length=None, min_classes=0, require=(), charset=None,
+                 allow=(), deny=()):
+        unknown = set(require) - POLICY_CLASSES.keys()
+        if unknown:
+            raise ValueError(f"Unknown character class(es): {', '.join(sorted(unknown))}")
+        if max_length is not None and max_length < min_length:
+            raise ValueError("Policy maximum length is below its minimum length")
+        if min_classes > len(POLICY_CLASSES):
+            raise ValueError(f"At most {len(POLICY_CLASSES)} character classes exist")
+        self.min_length = min_length
+        self.max_length = max_length
+        self.min_classes = min_classes
+        self.require = sorted(set(require))
+        self.charset = charset
+        self.allow = list(allow)
+        self.deny = list(deny)
+
+        # Compiled form
+        self.upper_bound = max_length if max_length is not None else float('inf')
+        self.allowed = frozenset(charset) if charset else None
+        self.class_table = str.maketrans({char: name[0] for name, chars in POLICY_CLASSES.items() for char in chars})
+        self.class_codes = frozenset(name[0] for name in POLICY_CLASSES)
+        self.required_codes = frozenset(name[0] for name in self.require)
+        self.allow_rx = re.compile('|'.join(f"(?:{pattern})" for pattern in self.allow)) if self.allow else None
+        self.deny_rx = re.compile('|'.join(f"(?:{pattern})" for pattern in self.deny)) if self.deny else None
+        # Per-class alphabets of the random fill, restricted to the charset
+        self.fill_classes = {name: ''.join(char for char in chars if self.allowed is None or char in self.allowed)
+                             for name, chars in POLICY_CLASSES.items()}
+        self.fill_chars = ''.join(sorted(self.allowed)) if self.allowed else POLICY_FILL_CHARS
+        for name in self.require:
+            if not self.fill_classes[name]:
+                raise ValueError(f"Policy charset has no '{name}' characters")
+
+    def spec(self):
+        return {'min_length': self.min_length, 'max_length': self.max_length, 'min_classes': self.min_classes,
+                'require': self.require, 'charset': self.charset, 'allow': self.allow, 'deny': self.deny}
+
+    def __call__(self, candidate):
+        if not self.min_length <= len(candidate) <= self.upper_bound:
+            return False
+        if self.allowed is not None and not self.allowed.issuperset(candidate):
+            return False
+        if self.min_classes or self.required_codes:
+            present = self.class_codes.intersection(candidate.translate(self.class_table))
+            if len(present) < self.min_classes or not self.required_codes <= present:
+                return False
+        if self.deny_rx is not None and self.deny_rx.search(candidate):
+            return False
+        if self.allow_rx is not None and not self.allow_rx.search(candidate):
+            return False
+        return True
+
+    def random(self, rng, min_len=8, max_len=12):
+        """Random candidate built to satisfy the length, class and charset rules"""
+        # Callers' default lengths must not override a shorter max_length
+        low = min(max(min_len, self.min_length), self.upper_bound)
+        length = rng.randint(low, max(low, min(max_len, self.upper_bound)))
+        classes = list(self.require)
+        spare = [name for name in POLICY_CLASSES if name not in classes and self.fill_classes[name]]
+        rng.shuffle(spare)
+        classes += spare[:max(0, self.min_classes - len(classes))]
+        chars = [rng.choice(self.fill_classes[name]) for name in classes]
+        chars += [rng.choice(self.fill_chars) for _ in range(length - len(chars))]
+        rng.shuffle(chars)
+        return ''.join(chars)
+
+
+# ==========[ PROFILE TOKENS ]==========
+class ProfileTokens:
+    """Normalized token table of one profile, built once per generator.
+
+    words/weights/kinds: every extracted word with its strongest field
+    weight and kind ('name', 'date', 'digits' or 'text'). digits holds the
+    digit string of each date/contact field and year2/year4/phone4 the
+    fragments the stages append; fields maps every profile field to its
+    normalized tokens (used by hybrid masks).
+    """
+
+    NAME_FIELDS = ('name', 'surname', 'nick', 'spouse', 'child', 'pet', 'mother', 'father', 'player')
+    DIGIT_FIELDS = ('birth', 'anniversary', 'phone')
+
+    def __init__(self, data):
+        self.digits = {field: ''.join(filter(str.isdigit, str(data.get(field, '')))) for field in self.DIGIT_FIELDS}
+        birth = self.digits['birth']
+        self.year2 = birth[-2:] if len(birth) >= 2 else ''
+        self.year4 = birth[-4:] if len(birth) >= 4 else self.year2
+        phone = self.digits['phone']
+        self.phone4 = phone[-4:] if len(phone) >= 4 else ''
+        self.weights = {}
+        self.kinds = {}
+        self.words = self._extract(data)
+        self.fields = {}
+        for field, value in data.items():
+            items = [item.strip() for item in str(value).split(',') if item.strip()]
+            if field in self.DIGIT_FIELDS:
+                tokens = [''.join(filter(str.isdigit, item)) for item in items]
+            else:
+                tokens = [variant for item in items for variant in (item.lower(), item.capitalize())]
+            tokens = list(dict.fromkeys(token for token in tokens if token))
+            if tokens:
+                self.fields[field] = tokens
+
+    def field_kind(self, field):
+        if field in self.NAME_FIELDS:
+            return 'name'
+        if field in ('birth', 'anniversary'):
+            return 'date'
+        if field == 'phone':
+            return 'digits'
+        return 'text'
+
+    def _extract(self, data):
+        """Profile words, their strongest field weight and kind"""
         words_set = set()
 
+        def add(word, field):
+            # Remember the strongest profile field each word came from
+            words_set.add(word)
+            weight = FIELD_WEIGHTS.get(field, DEFAULT_FIELD_WEIGHT)
+            if weight >= self.weights.get(word, 0):
+                self.weights[word] = weight
+                self.kinds[word] = self.field_kind(field)
+
+        def add_items(field):
+            # Every text field may hold a comma-separated list, as in self.fields
+            for item in data.get(field, '').split(','):
+                item = item.strip()
+                if item:
+                    add(item.lower(), field)
+                    add(item.capitalize(), field)
+
         # Personal information
         fields = ['name', 'surname', 'nick', 'city', 'country']
         for field in fields:
-            value = self.data.get(field, '').strip()
-            if value:
-                words_set.add(value.lower())
-                words_set.add(value.capitalize())
+            add_items(field)
 
         # Favorite teams and sports
         favorite_fields = ['team', 'player', 'sport']
         for field in favorite_fields:
-            value = self.data.get(field, '').strip()
-            if value:
-                # Split by comma for multiple entries
-                items = value.split(',')
-                for item in items:
-                    item = item.strip()
-                    if item:
-                        words_set.add(item.lower())
-                        words_set.add(item.capitalize())
+            add_items(field)
 
         # Family and important people
         family_fields = ['spouse', 'child', 'pet', 'mother', 'father']
         for field in family_fields:
-            value = self.data.get(field, '').strip()
-            if value:
-                words_set.add(value.lower())
-                words_set.add(value.capitalize())
+            add_items(field)
 
         # Important dates (birth, anniversary, etc.)
         date_fields = ['birth', 'anniversary']
         for field in date_fields:
-            value = self.data.get(field, '').strip()
+            value = data.get(field, '').strip()
             if value:
-                # Clean date to get only digits
-                date_digits = ''.join(filter(str.isdigit, value))
+                date_digits = self.digits[field]
                 if date_digits:
                     if len(date_digits) >= 4:
-                        words_set.add(date_digits[-4:])  # Full year
-                        words_set.add(date_digits[-2:])  # Last 2 digits
+                        add(date_digits[-4:], field)  # Full year
+                        add(date_digits[-2:], field)  # Last 2 digits
                     if len(date_digits) == 8:  # Full date DDMMYYYY
-                        words_set.add(date_digits[:4])  # DDMM
-                        words_set.add(date_digits[4:])  # YYYY
+                        add(date_digits[:4], field)  # DDMM
+                        add(date_digits[4:], field)  # YYYY
 
         # Contact information
         contact_fields = ['phone', 'email_local']
         for field in contact_fields:
-            value = self.data.get(field, '').strip()
+            value = data.get(field, '').strip()
             if value:
                 # For phone numbers, extract digits
                 if field == 'phone':
-                    phone_digits = ''.join(filter(str.isdigit, value))
+                    phone_digits = self.digits[field]
                     if phone_digits:
-                        words_set.add(phone_digits[-4:])  # Last 4 digits
+                        add(phone_digits[-4:], field)  # Last 4 digits
                         if len(phone_digits) >= 6:
-                            words_set.add(phone_digits[-6:])  # Last 6 digits
+                            add(phone_digits[-6:], field)  # Last 6 digits
                         if len(phone_digits) >= 10:
-                            words_set.add(phone_digits[-10:])  # Last 10 digits
+                            add(phone_digits[-10:], field)  # Last 10 digits
                 else:
-                    words_set.add(value.lower())
+                    for item in value.split(','):
+                        if item.strip():
+                            add(item.strip().lower(), field)
 
         # Hobbies and interests
-        hobbies = self.data.get('hobby', '').strip()
-        if hobbies:
-            for item in hobbies.split(','):
-                item = item.strip()
-                if item:
-                    words_set.add(item.lower())
-                    words_set.add(item.capitalize())
+        add_items('hobby')
 
         # Job and education
         job_fields = ['job', 'company', 'school', 'university']
         for field in job_fields:
-            value = self.data.get(field, '').strip()
-            if value:
-                words_set.add(value.lower())
-                words_set.add(value.capitalize())
+            add_items(field)
 
         # Car and bike models
         vehicle_fields = ['car', 'bike']
         for field in vehicle_fields:
-            value = self.data.get(field, '').strip()
-            if value:
-                words_set.add(value.lower())
-                words_set.add(value.capitalize())
+            add_items(field)
 
         # Favorite things
-        favorites = self.data.get('favorite', '').strip()
-        if favorites:
-            for item in favorites.split(','):
-                item = item.strip()
-                if item:
-                    words_set.add(item.lower())
-                    words_set.add(item.capitalize())
+        add_items('favorite')
 
-        return list(words_set)
+        return sorted(words_set)  # Stable order keeps seeded runs reproducible
+
+
+# ==========[ TOKEN CACHE ]==========
+class TokenCache:
+    """Derived words and base combinations of recent profiles, one JSON file each.
+
+    Keys hash the profile plus every generator parameter that shapes the
+    tokens. Reads touch the file, so the oldest mtime is the least recently
+    used entry and is evicted once more than max_entries are stored.
+    """
+
+    VERSION = 2  # Bump whenever derived words or base recipes change
+
+    def __init__(self, folder=None, max_entries=TOKEN_CACHE_ENTRIES):
+        self.folder = folder or TOKEN_CACHE_DIR
+        self.max_entries = max_entries
+
+    @classmethod
+    def key(cls, profile, params):
+        payload = json.dumps({'version': cls.VERSION, 'profile': profile, 'params': params},
+                             sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.folder, f"{key}.json")
+
+    def get(self, key):
+        """Cached value for key, None on a miss or unreadable entry"""
+        try:
+            with open(self.path(key), 'r', encoding='utf-8') as f:
+                value = json.load(f)
+            os.utime(self.path(key))
+        except (OSError, ValueError):
+            return None
+        return value
+
+    def put(self, key, value):
+        """Store value atomically, then evict least recently used entries"""
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            tmp_path = self.path(key) + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(value, f, separators=(',', ':'))
+            os.replace(tmp_path, self.path(key))
+            self.evict()
+        except OSError:
+            pass  # Read-only or full disk: generation works without the cache
+
+    def evict(self):
+        with os.scandir(self.folder) as scan:
+            entries = [(entry.stat().st_mtime_ns, entry.path) for entry in scan if entry.name.endswith('.json')]
+        entries.sort()
+        for _, path in entries[:max(0, len(entries) - self.max_entries)]:
+            os.remove(path)
 
-    def generate_base_combinations(self, words):
-        """Generate base password combinations"""
-        combinations = set()
 
-        print("[+] Generating base combinations...")
+# ==========[ PASSWORD GENERATOR ]==========
+class PasswordGenerator:
+    def __init__(self, user_data, seed=None, verbose=True, dedup='set', fp_rate=0.001,
+                 leet_depth=LEET_MAX_DEPTH, leet_budgets=None, stats=None,
+                 combo_depth=COMBO_DEPTH, combo_words=COMBO_WORDS, separators=None, cache_dir=None, policy=None):
+        self.data = user_data
+        self.tokens = ProfileTokens(user_data)
+        self.word_weights = {}
+        self.stage = None  # Expansion stage currently producing candidates
+        self.stats = stats
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.verbose = verbose
+        self.dedup = dedup
+        self.fp_rate = fp_rate
+        self.leet_depth = leet_depth
+        self.leet_budgets = leet_budgets
+        self.leet = LeetEngine(max_depth=leet_depth, budgets=leet_budgets)
+        self.combo_depth = combo_depth
+        self.combo_words = combo_words
+        self.separators = list(COMBO_SEPARATORS if separators is None else separators)
+        self.all_words = []
+        self.fills = {}  # RandomFill per (alphabet, min_len, max_len)
+        self.cache_dir = cache_dir
+        self.cache = TokenCache(cache_dir) if cache_dir else None
+        # A PasswordPolicy or its spec() dict; every kept candidate must pass it
+        self.policy = PasswordPolicy(**policy) if isinstance(policy, dict) else policy
+        self.symbols = ['!', '@', '#', '$', '%', '^', '&', '*', '-', '_', '+', '=']
+        self.numbers = ['123', '1234', '12345', '123456', '111', '222', '333', '444', '555',
+                        '666', '777', '888', '999', '000', '1111', '2222', '3333', '2020',
+                        '2021', '2022', '2023', '2024', '2025']
+
+    def options(self):
+        """Constructor keywords (other than seed/verbose) to rebuild this generator elsewhere"""
+        return {
+            'dedup': self.dedup,
+            'fp_rate': self.fp_rate,
+            'leet_depth': self.leet_depth,
+            'leet_budgets': self.leet_budgets,
+            'combo_depth': self.combo_depth,
+            'combo_words': self.combo_words,
+            'separators': self.separators,
+            'cache_dir': self.cache_dir,
+            'policy': self.policy.spec() if self.policy is not None else None,
+        }
+
+    def enter_stage(self, stage, pool=None):
+        """Mark the stage now producing candidates (None when expansion ends)"""
+        self.stage = stage
+        if self.stats is not None:
+            self.stats.begin(stage, pool)
+
+    def random_text(self, alphabet, min_len, max_len):
+        """Random string of alphabet, drawn in blocks from a seeded RandomFill"""
+        key = (alphabet, min_len, max_len)
+        if key not in self.fills:
+            self.fills[key] = RandomFill(alphabet, min_len, max_len, self.rng)
+        return self.fills[key]()
+
+    def log(self, message):
+        """Print a progress message unless running quietly"""
+        if self.verbose:
+            print(message)
 
+    def extract_words(self):
+        """Extract all possible words from user data"""
+        for word, weight in self.tokens.weights.items():
+            self.word_weights[word] = max(self.word_weights.get(word, 0), weight)
+        return list(self.tokens.words)
+
+    def generate_base_combinations(self, words):
+        """Generate base password combinations"""
+        self.log("[+] Generating base combinations...")
+        return list(dict.fromkeys(self.iter_base_combinations(words)))
+
+    def iter_base_combinations(self, words):
+        """Lazily yield base password combinations (may contain repeats)"""
+        for _, combination in self.iter_scored_base_combinations(words):
+            yield combination
+
+    def word_weight(self, word):
+        return self.word_weights.get(word, DEFAULT_FIELD_WEIGHT)
+
+    def number_tokens(self):
+        """Profile digit tokens for the combinator, mapped to their field weight"""
+        tokens = {}
+        if len(self.tokens.digits['birth']) >= 4:
+            tokens[self.tokens.year4] = FIELD_WEIGHTS['birth']
+        if self.tokens.year2:
+            tokens.setdefault(self.tokens.year2, FIELD_WEIGHTS['birth'])
+        if self.tokens.phone4:
+            tokens.setdefault(self.tokens.phone4, FIELD_WEIGHTS['phone'])
+        return tokens
+
+    def is_numeric_word(self, word):
+        """Date or phone-derived word: gluing more dates to it reads as noise, not as a password"""
+        return self.tokens.kinds.get(word) in ('date', 'digits') or word.isdigit()
+
+    def iter_scored_base_combinations(self, words):
+        """Lazily yield (likelihood score, combination) pairs, may contain repeats"""
+        year2, year4, last4 = self.tokens.year2, self.tokens.year4, self.tokens.phone4
         # Single words with numbers
         for word in words:
+            weight = self.word_weight(word)
+            numeric = self.is_numeric_word(word)
             # Word + common numbers
             for num in self.numbers[:10]:  # Use first 10 numbers
-                combinations.add(f"{word}{num}")
-                combinations.add(f"{num}{word}")
+                yield weight + 1, f"{word}{num}"
+                yield weight, f"{num}{word}"
 
             # Word + birth year if available
-            birth = self.data.get('birth', '').strip()
-            if birth:
-                birth_digits = ''.join(filter(str.isdigit, birth))
-                if birth_digits and len(birth_digits) >= 2:
-                    year2 = birth_digits[-2:]
-                    year4 = birth_digits[-4:] if len(birth_digits) >= 4 else year2
-                    combinations.add(f"{word}{year2}")
-                    combinations.add(f"{word}{year4}")
-                    combinations.add(f"{year2}{word}")
-                    combinations.add(f"{year4}{word}")
+            if year2 and not numeric:
+                yield weight + 3, f"{word}{year2}"
+                yield weight + 3, f"{word}{year4}"
+                yield weight + 1, f"{year2}{word}"
+                yield weight + 1, f"{year4}{word}"
 
             # Word + phone last 4 if available
-            phone = self.data.get('phone', '').strip()
-            if phone:
-                phone_digits = ''.join(filter(str.isdigit, phone))
-                if phone_digits and len(phone_digits) >= 4:
-                    last4 = phone_digits[-4:]
-                    combinations.add(f"{word}{last4}")
-                    combinations.add(f"{last4}{word}")
+            if last4 and not numeric:
+                yield weight + 2, f"{word}{last4}"
+                yield weight, f"{last4}{word}"
 
             # Word with symbols
             for symbol in self.symbols[:5]:  # Use first 5 symbols
-                combinations.add(f"{word}{symbol}")
-                combinations.add(f"{symbol}{word}")
-
-        # Word + word combinations
-        if len(words) >= 2:
-            for i in range(min(20, len(words))):  # Limit to 20 words to avoid explosion
-                for j in range(min(20, len(words))):
-                    if i != j:
-                        word1 = words[i]
-                        word2 = words[j]
-                        # Direct combination
-                        combinations.add(f"{word1}{word2}")
-                        combinations.add(f"{word2}{word1}")
-                        # With separator
-                        for sep in ['', '_', '-', '.', '@']:
-                            combinations.add(f"{word1}{sep}{word2}")
-                            combinations.add(f"{word2}{sep}{word1}")
+                yield weight + 1, f"{word}{symbol}"
+                yield weight - 1, f"{symbol}{word}"
+
+        # Word + word (+ number) combinations, strongest words first
+        ranked_words = sorted(words, key=self.word_weight, reverse=True)
+        if self.combo_words is not None:
+            ranked_words = ranked_words[:self.combo_words]
+        numbers = self.number_tokens()
+        weights = {word: self.word_weight(word) for word in ranked_words}
+        weights.update(numbers)
+        combinator = Combinator(ranked_words, list(numbers), self.separators, self.combo_depth)
+        for parts, sep in combinator:
+            score = sum(weights[part] for part in parts) // len(parts) - (len(parts) - 2)
+            yield (score - 1 if sep else score), sep.join(parts)
 
         # Special combinations for sports teams with jersey numbers
         team = self.data.get('team', '').strip()
@@ -422,90 +2023,183 @@ class PasswordGenerator:
             team_lower = team.lower()
             # Common jersey numbers
             jersey_numbers = ['1', '7', '8', '9', '10', '11', '17', '23', '24', '99']
+            team_weight = FIELD_WEIGHTS['team']
             for num in jersey_numbers:
-                combinations.add(f"{team_lower}{num}")
-                combinations.add(f"{team}{num}")
-                combinations.add(f"{team_lower}{num}!")
-                combinations.add(f"{team}{num}!")
-
-        return list(combinations)
+                yield team_weight + 2, f"{team_lower}{num}"
+                yield team_weight + 2, f"{team}{num}"
+                yield team_weight + 1, f"{team_lower}{num}!"
+                yield team_weight + 1, f"{team}{num}!"
+
+    def build_rules(self):
+        """Hashcat-style rules that reproduce the expansion stages on the cracker side.
+
+        Covers leet (Stage 1), symbol wrapping (Stage 2, also on leet forms)
+        and the deterministic Stage 3 mutations. Random letter suffixes have
+        no finite rule form and non-ASCII replacements are skipped.
+        """
+        def append(text):
+            return ' '.join(f"${char}" for char in text)
+
+        def prepend(text):
+            return ' '.join(f"^{char}" for char in reversed(text))
+
+        rules = [':']
+
+        # Stage 1: leet, applied to both cases like the translate tables
+        leet_rules = []
+        for choice in self.leet.choices(sorted(self.leet.substitutions)):
+            if all(replacement.isascii() for _, replacement in choice):
+                leet_rules.append(' '.join(f"s{char}{replacement} s{char.upper()}{replacement}"
+                                           for char, replacement in choice))
+        rules.extend(leet_rules)
+
+        # Stage 2: symbols at beginning/end, on base and leet forms
+        for symbol in self.symbols[:3]:
+            for symbol_rule in (prepend(symbol), append(symbol), f"{prepend(symbol)} {append(symbol)}"):
+                rules.append(symbol_rule)
+                rules.extend(f"{leet_rule} {symbol_rule}" for leet_rule in leet_rules)
+
+        # Stage 3: numbers, symbols, capitalization, reverse, double, profile digits
+        rules.extend(append(num) for num in self.numbers)
+        rules.extend(append(str(num)) for num in range(100))
+        rules.extend(append(symbol) for symbol in self.symbols)
+        rules.extend(['T0', 'T0 T1', 'T0 T1 T2', 'r', 'd'])
+        if self.tokens.year2:
+            rules.append(append(self.tokens.year2))
+        if self.tokens.phone4:
+            rules.append(append(self.tokens.phone4))
+
+        return list(dict.fromkeys(rules))
 
     def expand_with_variations(self, base_passwords, target_count):
         """Expand base passwords with variations to reach target count"""
-        all_passwords = set(base_passwords)
-
-        print(f"[+] Starting with {len(all_passwords)} base passwords")
-        print(f"[+] Expanding to reach {target_count}...")
-
-        # If we already have enough, return
-        if len(all_passwords) >= target_count:
-            return list(all_passwords)[:target_count]
+        return list(self.iter_variations(base_passwords, target_count))
+
+    def iter_variations(self, base_passwords, target_count, pool=None):
+        """Lazily expand base passwords, yielding each new unique candidate.
+
+        Stops as soon as target_count candidates have been accepted by the pool.
+        Only the base passwords and their leet forms are kept in memory; Stage 3
+        samples from the pool, which can be capped for streaming runs.
+        """
+        scored_base = ((DEFAULT_FIELD_WEIGHT, password) for password in base_passwords)
+        for _, password in self.iter_scored_variations(scored_base, target_count, pool):
+            yield password
+
+    def iter_scored_variations(self, scored_base, target_count, pool=None, replay=False):
+        """iter_variations() over (score, password) pairs, yielding (score, password).
+
+        Each candidate's likelihood score is derived from its source's score
+        and the stage that produced it. replay=True means the pool already
+        holds an earlier run's output: those candidates are not yielded again
+        but still feed the later stages, so expansion resumes where it stopped.
+        """
+        if pool is None:
+            pool = self.new_pool(target_count)
+        try:
+            yield from self._expand(scored_base, target_count, pool, replay)
+        finally:
+            self.enter_stage(None, pool)
+
+    def _expand(self, scored_base, target_count, pool, replay=False):
+        """Body of iter_scored_variations(): the base pass and Stages 1-3"""
+        stats = self.stats
+        policy = self.policy
+        # Sources that are not kept: rejected by the policy (they may still
+        # grow into compliant candidates) or already kept by an extended run
+        held = set() if replay or policy is not None else None
+
+        # Base passwords first, remembered as sources for Stages 1 and 2
+        self.enter_stage('base', pool)
+        sources = []
+        for score, password in scored_base:
+            if policy is None or policy(password):
+                if pool.add(password):
+                    sources.append((score, password))
+                    yield score, password
+                    if len(pool) >= target_count:
+                        return
+                    continue
+                if not replay:
+                    continue
+            if held is not None and password not in held:
+                held.add(password)
+                sources.append((score, password))
+
+        self.log(f"[+] Starting with {len(pool)} base passwords")
+        self.log(f"[+] Expanding to reach {target_count}...")
 
         # Stage 1: Add leet variations
-        stage1_count = len(all_passwords)
-        if stage1_count < target_count:
-            print("[+] Stage 1: Adding leet variations...")
-            base_list = list(all_passwords)
-            for password in base_list:
-                if len(all_passwords) >= target_count * 2:  # Generate extra for selection
-                    break
-                # Simple leet transformation
-                leet_pass = password
-                replacements = {'a': '@', 'e': '3', 'i': '1', 'o': '0', 's': '$', 't': '7'}
-                for old, new in replacements.items():
-                    if random.random() > 0.7:  # 30% chance to replace each character
-                        leet_pass = leet_pass.replace(old, new).replace(old.upper(), new)
-                if leet_pass != password:
-                    all_passwords.add(leet_pass)
+        self.enter_stage('leet', pool)
+        self.log("[+] Stage 1: Adding leet variations...")
+        for score, password in sources[:len(sources)]:
+            for leet_pass in self.leet.variations(password):
+                if policy is None or policy(leet_pass):
+                    if pool.add(leet_pass):
+                        sources.append((score - 2, leet_pass))
+                        yield score - 2, leet_pass
+                        if len(pool) >= target_count:
+                            return
+                        continue
+                    if not replay:
+                        continue
+                if held is not None and leet_pass not in held:
+                    held.add(leet_pass)
+                    sources.append((score - 2, leet_pass))
 
         # Stage 2: Add symbol variations
-        stage2_count = len(all_passwords)
-        if stage2_count < target_count * 2:
-            print("[+] Stage 2: Adding symbol variations...")
-            base_list = list(all_passwords)
-            for password in base_list:
-                if len(all_passwords) >= target_count * 3:  # Generate extra
-                    break
-                # Add symbols at beginning/end
-                for symbol in self.symbols[:3]:
-                    all_passwords.add(f"{symbol}{password}")
-                    all_passwords.add(f"{password}{symbol}")
-                    all_passwords.add(f"{symbol}{password}{symbol}")
+        self.enter_stage('symbols', pool)
+        self.log("[+] Stage 2: Adding symbol variations...")
+        for score, password in sources:
+            # Add symbols at beginning/end
+            for symbol in self.symbols[:3]:
+                for new_score, new_pass in ((score - 2, f"{symbol}{password}"),
+                                            (score - 1, f"{password}{symbol}"),
+                                            (score - 3, f"{symbol}{password}{symbol}")):
+                    if (policy is None or policy(new_pass)) and pool.add(new_pass):
+                        yield new_score, new_pass
+                        if len(pool) >= target_count:
+                            return
 
         # Stage 3: Random mutations (guaranteed to reach target)
-        print("[+] Stage 3: Random mutations (guaranteed)...")
+        self.enter_stage('mutations', pool)
+        self.log("[+] Stage 3: Random mutations (guaranteed)...")
         attempts = 0
         max_attempts = target_count * 10  # Safety limit
 
-        while len(all_passwords) < target_count and attempts < max_attempts:
+        while len(pool) < target_count and attempts < max_attempts:
             attempts += 1
 
             # Create new password from scratch if needed
-            if random.random() < 0.3 or len(all_passwords) < 100:
+            score = STAGE3_SCORE
+            if self.rng.random() < 0.3 or len(pool) < 100:
+                score = RANDOM_SCORE
+                mutation_type = 0
                 # Create completely random password
-                length = random.randint(6, 12)
-                new_pass = ''.join(random.choices(string.ascii_lowercase + string.digits, k=length))
-                # Add symbol
-                if random.random() > 0.5:
-                    new_pass += random.choice(self.symbols)
-                all_passwords.add(new_pass)
+                if policy is not None:
+                    new_pass = policy.random(self.rng, 6, 12)
+                else:
+                    new_pass = self.random_text(string.ascii_lowercase + string.digits, 6, 12)
+                    # Add symbol
+                    if self.rng.random() > 0.5:
+                        new_pass += self.rng.choice(self.symbols)
             else:
                 # Mutate existing password
-                base_pass = random.choice(list(all_passwords))
+                base_pass = pool.sample()
 
                 # Apply random mutation
-                mutation_type = random.randint(1, 8)
+                mutation_type = self.rng.randint(1, 8)
 
                 if mutation_type == 1:
                     # Add number
-                    new_pass = base_pass + str(random.randint(0, 9999))
+                    new_pass = base_pass + str(self.rng.randint(0, 9999))
                 elif mutation_type == 2:
                     # Add symbol
-                    new_pass = base_pass + random.choice(self.symbols)
+                    new_pass = base_pass + self.rng.choice(self.symbols)
                 elif mutation_type == 3:
                     # Capitalize random letters
                     chars = list(base_pass)
-                    for i in range(random.randint(1, 3)):
+                    for i in range(self.rng.randint(1, 3)):
                         if i < len(chars) and chars[i].isalpha():
                             chars[i] = chars[i].upper()
                     new_pass = ''.join(chars)
@@ -517,95 +2211,964 @@ class PasswordGenerator:
                     new_pass = base_pass * 2
                 elif mutation_type == 6:
                     # Add birth year if available
-                    birth = self.data.get('birth', '').strip()
-                    if birth:
-                        birth_digits = ''.join(filter(str.isdigit, birth))
-                        if birth_digits and len(birth_digits) >= 2:
-                            new_pass = base_pass + birth_digits[-2:]
-                        else:
-                            new_pass = base_pass + str(random.randint(10, 99))
+                    if self.tokens.year2:
+                        new_pass = base_pass + self.tokens.year2
+                        score += 1
                     else:
-                        new_pass = base_pass + str(random.randint(10, 99))
+                        new_pass = base_pass + str(self.rng.randint(10, 99))
                 elif mutation_type == 7:
                     # Add phone last digits if available
-                    phone = self.data.get('phone', '').strip()
-                    if phone:
-                        phone_digits = ''.join(filter(str.isdigit, phone))
-                        if phone_digits and len(phone_digits) >= 4:
-                            new_pass = base_pass + phone_digits[-4:]
-                        else:
-                            new_pass = base_pass + str(random.randint(1000, 9999))
+                    if self.tokens.phone4:
+                        new_pass = base_pass + self.tokens.phone4
+                        score += 1
                     else:
-                        new_pass = base_pass + str(random.randint(1000, 9999))
+                        new_pass = base_pass + str(self.rng.randint(1000, 9999))
                 else:
                     # Random suffix
-                    suffix = ''.join(random.choices(string.ascii_lowercase, k=random.randint(2, 4)))
+                    suffix = self.random_text(string.ascii_lowercase, 2, 4)
                     new_pass = base_pass + suffix
 
-                all_passwords.add(new_pass)
+            accepted = (policy is None or policy(new_pass)) and pool.add(new_pass)
+            if stats is not None:
+                stats.mutation(mutation_type, accepted)
+            if accepted:
+                yield score, new_pass
 
             # Progress indicator
             if attempts % 1000 == 0:
-                print(f"  Generated: {len(all_passwords):,} / {target_count:,}")
+                self.log(f"  Generated: {len(pool):,} / {target_count:,}")
+
+        if stats is not None:
+            stats.note('mutations', attempts=attempts, max_attempts=max_attempts,
+                       saturated=attempts >= max_attempts and len(pool) < target_count)
 
         # Final check - if still not enough, add completely random passwords
-        if len(all_passwords) < target_count:
-            print(f"[!] Generating {target_count - len(all_passwords):,} random passwords as fallback...")
-            needed = target_count - len(all_passwords)
-            for i in range(needed):
+        if len(pool) < target_count:
+            self.enter_stage('fallback', pool)
+            self.log(f"[!] Generating {target_count - len(pool):,} random passwords as fallback...")
+            if policy is not None:
+                for new_pass in self._policy_fill(pool, target_count):
+                    yield RANDOM_SCORE, new_pass
+            while len(pool) < target_count:
                 # Generate random password
-                length = random.randint(8, 15)
                 parts = []
-                parts.append(''.join(random.choices(string.ascii_lowercase, k=random.randint(3, 6))))
-                parts.append(str(random.randint(100, 9999)))
-                if random.random() > 0.5:
-                    parts.append(random.choice(self.symbols))
+                parts.append(self.random_text(string.ascii_lowercase, 3, 6))
+                parts.append(str(self.rng.randint(100, 9999)))
+                if self.rng.random() > 0.5:
+                    parts.append(self.rng.choice(self.symbols))
 
                 new_pass = ''.join(parts)
-                all_passwords.add(new_pass)
-
-        return list(all_passwords)[:target_count]
-
-    def generate(self, target_count):
-        """Main generation method - GUARANTEED to return exactly target_count passwords"""
-        print(f"\n[+] Target: {target_count:,} passwords")
-
+                if pool.add(new_pass):
+                    yield RANDOM_SCORE, new_pass
+
+    def new_pool(self, target_count, pool_size=None, candidates=()):
+        """Candidate pool backed by the configured dedup backend.
+
+        Compact backends exist to avoid holding every candidate, so their
+        sampling list is always capped.
+        """
+        if pool_size is None and self.dedup != 'set':
+            pool_size = STREAM_POOL_SIZE
+        dedup = make_dedup(self.dedup, target_count, self.fp_rate)
+        return CandidatePool(candidates, capacity=pool_size, rng=self.rng, dedup=dedup)
+
+    def estimate_keyspace(self):
+        """Dry run: candidates each stage can produce, without materializing them.
+
+        Raw counts come from formulas (LeetEngine.count, the per-word base
+        recipe, len(Combinator)); distinct counts stream the candidates
+        through HyperLogLog sketches in constant memory to account for
+        overlap. Stage 2 is 9 symbol forms per distinct Stage 0/1 source.
+        """
+        words = self.derive_words()
+        ranked_words = sorted(words, key=self.word_weight, reverse=True)
+        if self.combo_words is not None:
+            ranked_words = ranked_words[:self.combo_words]
+        combinator = Combinator(ranked_words, list(self.number_tokens()), self.separators, self.combo_depth)
+
+        per_word = 2 * len(self.numbers[:10]) + 2 * len(self.symbols[:5])
+        per_text_word = (4 if self.tokens.year2 else 0) + (2 if self.tokens.phone4 else 0)
+        text_words = sum(not self.is_numeric_word(word) for word in words)
+        base_raw = per_word * len(words) + per_text_word * text_words + len(combinator) + (40 if self.data.get('team', '').strip() else 0)
+
+        base_sketch = HyperLogLog()
+        leet_sketch = HyperLogLog()
+        leet_raw = 0
+        for combination in self.iter_base_combinations(words):
+            base_sketch.add(combination)
+            leet_raw += self.leet.count(combination)
+            leet_sketch.update(self.leet.variations(combination))
+
+        sources = HyperLogLog()
+        sources.merge(base_sketch)
+        sources.merge(leet_sketch)
+        symbols = 9 * len(sources)
+        return {
+            'words': len(words),
+            'base': {'raw': base_raw, 'distinct': len(base_sketch)},
+            'leet': {'raw': leet_raw, 'distinct': len(leet_sketch)},
+            'symbols': {'distinct': symbols},
+            'total': len(sources) + symbols,
+        }
+
+    def derive_words(self):
+        """Steps 1-2: profile words plus their leet variations, deduplicated"""
         # Step 1: Extract all words from user data
         base_words = self.extract_words()
-        print(f"[+] Extracted {len(base_words)} base words")
+        self.log(f"[+] Extracted {len(base_words)} base words")
 
         # Step 2: Generate leet variations for base words
-        all_words = []
-        for word in base_words:
-            all_words.extend(get_leet_variations(word))
-        # Remove duplicates while preserving some order
         unique_words = []
-        seen = set()
-        for word in all_words:
-            if word not in seen:
-                seen.add(word)
-                unique_words.append(word)
-        print(f"[+] After leet variations: {len(unique_words)} unique words")
-
-        # Step 3: Generate base combinations
-        base_combinations = self.generate_base_combinations(unique_words)
-        print(f"[+] Generated {len(base_combinations):,} base combinations")
-
-        # Step 4: Expand to reach target count (GUARANTEED)
-        final_passwords = self.expand_with_variations(base_combinations, target_count)
-
-        # Ensure exact count
-        if len(final_passwords) > target_count:
-            final_passwords = final_passwords[:target_count]
-        elif len(final_passwords) < target_count:
+        for word in base_words:
+            weight = self.word_weight(word)
+            for variation in get_leet_variations(word, self.leet):
+                if variation.lower() == word.lower():
+                    # Case variants keep the field weight, shouting costs a point
+                    variation_weight = weight - 1 if variation.isupper() and not word.isupper() else weight
+                else:
+                    variation_weight = weight - 2
+                self.word_weights[variation] = max(self.word_weights.get(variation, variation_weight),
+                                                   variation_weight)
+                unique_words.append(variation)
+        unique_words = list(dict.fromkeys(unique_words))
+        self.log(f"[+] After leet variations: {len(unique_words)} unique words")
+        return unique_words
+
+    def derived_tokens(self):
+        """Steps 1-3: (derived words, scored base combinations), via the token cache.
+
+        Without a cache the base combinations stream lazily. With one, a hit
+        skips straight to expansion and a miss stores the words, their
+        weights and (up to TOKEN_CACHE_MAX_BASE pairs) the base combinations.
+        """
+        if self.cache is None:
+            words = self.derive_words()
+            self.log("[+] Generating base combinations...")
+            return words, self.iter_scored_base_combinations(words)
+
+        key = TokenCache.key(self.data, {
+            'leet_depth': self.leet_depth, 'leet_budgets': self.leet_budgets, 'combo_depth': self.combo_depth,
+            'combo_words': self.combo_words, 'separators': self.separators,
+            'symbols': self.symbols, 'numbers': self.numbers,
+        })
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.word_weights.update(cached['weights'])
+            self.log(f"[+] Token cache hit: {len(cached['words'])} words, "
+                     f"{len(cached['base']):,} base combinations")
+            return cached['words'], cached['base']
+
+        words = self.derive_words()
+        self.log("[+] Generating base combinations...")
+        base = self.iter_scored_base_combinations(words)
+        head = list(islice(base, TOKEN_CACHE_MAX_BASE + 1))
+        if len(head) > TOKEN_CACHE_MAX_BASE:
+            return words, chain(head, base)
+        self.cache.put(key, {'words': words, 'weights': self.word_weights, 'base': head})
+        return words, head
+
+    def mask_engine(self, mask, charsets=None):
+        """MaskEngine with this profile's words behind '?w' and its field names"""
+        return MaskEngine(mask, self.extract_words(), self.tokens.fields, charsets)
+
+    def generate(self, target_count, workers=1, ranked=False):
+        """Main generation method - GUARANTEED to return exactly target_count passwords"""
+        if workers > 1:
+            return list(self.iter_generate_parallel(target_count, workers))
+        if ranked:
+            return list(self.iter_ranked(target_count))
+        return list(self.iter_generate(target_count))
+
+    def iter_generate(self, target_count, pool_size=None, existing=None):
+        """Streaming generation - yields exactly target_count unique passwords.
+
+        pool_size caps the Stage 3 sampling pool so that, apart from the dedup
+        set, memory does not grow with target_count. existing (an earlier
+        run's output) counts towards target_count and only the missing
+        candidates are yielded.
+        """
+        for _, password in self.iter_scored(target_count, pool_size, existing=existing):
+            yield password
+
+    def iter_scored(self, target_count, pool_size=None, ranked=False, existing=None):
+        """iter_generate() yielding (likelihood score, password) pairs.
+
+        With ranked=True the (profile-sized) base combinations are sorted by
+        score first, so a target smaller than the base set keeps the strongest.
+        """
+        self.log(f"\n[+] Target: {target_count:,} passwords")
+        self.enter_stage('words')
+        # Step 3 + 4: Stream base combinations into the expansion stages (GUARANTEED)
+        _, base = self.derived_tokens()
+        if ranked:
+            # Only the strongest target_count can survive truncation
+            base = heapq.nlargest(target_count, base, key=lambda item: item[0])
+        if existing is None:
+            pool = self.new_pool(target_count, pool_size)
+        else:
+            pool = self.new_pool(target_count, pool_size, existing)
+            self.log(f"[+] Extending {len(pool):,} existing passwords")
+            if self.seed is not None:
+                # Fresh but reproducible Stage 3 draws instead of the earlier run's
+                self.rng.seed(f"{self.seed}:extend:{len(pool)}")
+        yield from self.iter_scored_variations(base, target_count, pool, replay=existing is not None)
+        for password in self._fill_exact(pool, target_count):
+            yield RANDOM_SCORE, password
+
+    def iter_ranked(self, target_count, pool_size=None):
+        """Streaming generation in descending likelihood order.
+
+        Candidates are bucketed by score, spilling to temporary files once
+        RANK_SPILL_LINES are held, then replayed from the highest bucket down.
+        """
+        buckets = ScoreBuckets()
+        try:
+            for score, password in self.iter_scored(target_count, pool_size, ranked=True):
+                buckets.add(score, password)
+            self.log("[+] Emitting candidates by likelihood...")
+            yield from buckets
+        finally:
+            buckets.close()
+
+    def iter_generate_parallel(self, target_count, workers, pool_size=None):
+        """Sharded generation across a process pool - yields exactly target_count unique passwords.
+
+        Base combinations are split round-robin into one shard per worker and
+        each worker expands its shard with its own deterministic seed. Global
+        dedup is partitioned too: every candidate belongs to the worker that
+        owns crc32(candidate) % workers, which keeps its first occurrence in
+        shard order. Each shard's surviving candidates land in a file in
+        their original order. The parent only streams those files, so the
+        exact-count and uniqueness guarantees (and the output) match a single
+        global pool without a per-candidate serial step. Shortfalls caused by
+        cross-shard duplicates are topped up by further seeded rounds.
+        """
+        self.log(f"\n[+] Target: {target_count:,} passwords ({workers} workers)")
+        _, base = self.derived_tokens()
+        base_combinations = list(dict.fromkeys(combination for _, combination in base))
+        self.log(f"[+] Generated {len(base_combinations):,} base combinations")
+
+        # Shard seeds derive from one run seed, so a seeded generator is reproducible
+        run_seed = self.seed if self.seed is not None else self.rng.getrandbits(64)
+        produced = 0
+        outputs = []
+        folder = tempfile.mkdtemp(prefix='gvdilix_parallel_')
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for round_num in range(PARALLEL_MAX_ROUNDS):
+                    deficit = target_count - produced
+                    if deficit <= 0:
+                        break
+                    # Small headroom per shard absorbs cross-shard duplicates
+                    quota = deficit * 105 // (100 * workers) + 1
+                    # Top-up rounds mutate a slice of what has already been accepted
+                    seeds = list(islice(chain.from_iterable(map(_read_spill, outputs)), PARALLEL_SEED_SIZE * workers))
+                    self.log(f"[+] Round {round_num + 1}: {workers} shards x {quota:,} candidates")
+                    expand = [
+                        (self.data, self.options(), f"{run_seed}:{round_num}:{shard}",
+                         base_combinations[shard::workers] if round_num == 0 else [],
+                         [seed.decode('utf-8') for seed in seeds[shard::workers]], quota,
+                         folder, round_num, shard, workers)
+                        for shard in range(workers)
+                    ]
+                    list(executor.map(_expand_shard, expand))
+                    dedup = [(folder, round_num, partition, workers, self.dedup, self.fp_rate,
+                              target_count // workers + 1) for partition in range(workers)]
+                    list(executor.map(_dedup_partition, dedup))
+                    outputs = list(executor.map(_stitch_shard, [(folder, round_num, shard, workers)
+                                                                 for shard in range(workers)]))
+                    for path in outputs:
+                        for password in _read_spill(path):
+                            yield password.decode('utf-8')
+                            produced += 1
+                            if produced >= target_count:
+                                return
+
+            if produced < target_count:
+                # Rare: the rounds ran dry, random fill needs every accepted candidate
+                accepted = chain.from_iterable(_read_spill(os.path.join(folder, name))
+                                               for name in sorted(os.listdir(folder)) if name.endswith('.accepted'))
+                pool = self.new_pool(target_count, pool_size, (line.decode('utf-8') for line in accepted))
+                yield from self._fill_exact(pool, target_count)
+        finally:
+            _remove_spill_dir(folder)
+
+    def _fill_exact(self, pool, target_count):
+        """Ensure exact count with random passwords if the stages fell short"""
+        if len(pool) < target_count:
             # This should never happen, but just in case
-            print(f"[!] WARNING: Only generated {len(final_passwords):,} passwords")
-            print(f"[!] Adding random passwords to reach {target_count:,}...")
-            while len(final_passwords) < target_count:
-                random_pass = ''.join(random.choices(string.ascii_letters + string.digits, k=random.randint(8, 12)))
-                final_passwords.append(random_pass)
+            self.log(f"[!] WARNING: Only generated {len(pool):,} passwords")
+            self.log(f"[!] Adding random passwords to reach {target_count:,}...")
+            if self.policy is not None:
+                yield from self._policy_fill(pool, target_count)
+            while len(pool) < target_count:
+                random_pass = self.random_text(string.ascii_letters + string.digits, 8, 12)
+                if pool.add(random_pass):
+                    yield random_pass
+
+    def _policy_fill(self, pool, target_count):
+        """Random policy-compliant candidates until the pool holds target_count"""
+        rejects = 0
+        while len(pool) < target_count:
+            candidate = self.policy.random(self.rng)
+            if self.policy(candidate) and pool.add(candidate):
+                rejects = 0
+                yield candidate
+            else:
+                rejects += 1
+                if rejects >= POLICY_MAX_REJECTS:
+                    raise ValueError(f"The password policy admits too few candidates "
+                                     f"({len(pool):,} of {target_count:,} found)")
+
+
+# ==========[ RULES OUTPUT ]==========
+def rules_path(filename):
+    """Rule file written next to a base-words list"""
+    base = filename
+    for ext in COMPRESSION_EXTENSIONS.values():
+        if base.endswith(ext):
+            base = base[:-len(ext)]
+    return (base[:-4] if base.endswith('.txt') else base) + '.rule'
+
+
+def write_rules_output(generator, filename):
+    """Write deduplicated base words to filename plus a matching .rule file.
+
+    Instead of expanding every mutation, the cracker applies the rules to the
+    words on the fly. Returns (word count, rule count, rule file path).
+    """
+    words = generator.extract_words()
+    base_words = list(dict.fromkeys(chain(words, generator.generate_base_combinations(words))))
+    word_count = write_wordlist(filename, base_words)
+
+    rules = generator.build_rules()
+    rule_file = rules_path(filename)
+    with open(rule_file, 'w', encoding='utf-8') as f:
+        f.write(f"# GVDILIX WordForge rules - {len(rules)} rules for {os.path.basename(filename)}\n")
+        f.writelines(f"{rule}\n" for rule in rules)
+
+    generator.log(f"[+] {word_count:,} base words x {len(rules):,} rules = {word_count * len(rules):,} candidates")
+    return word_count, len(rules), rule_file
+
+
+# ==========[ PARALLEL GENERATION ]==========
+def _parallel_path(folder, round_num, *parts):
+    return os.path.join(folder, '_'.join(map(str, (round_num,) + parts)))
+
+
+def _write_lines(path, lines):
+    """Write byte lines (without newline) to path, return the path"""
+    with open(path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        for data, _ in _byte_batches(iter(lines)):
+            f.write(data)
+    return path
+
+
+def _expand_shard(job):
+    """Process-pool worker, step 1: expand one shard, split it by owning partition.
+
+    Writes the shard's candidates to one '.part' file per partition plus an
+    '.order' file with the partition of every candidate, in output order.
+    """
+    user_data, options, seed, base_shard, seeds, quota, folder, round_num, shard, partitions = job
+    generator = PasswordGenerator(user_data, seed=seed, verbose=False, **options)
+    # Seeds only feed Stage 3 sampling; they are already accepted globally
+    pool = generator.new_pool(len(seeds) + quota, candidates=seeds)
+    candidates = [password.encode('utf-8') for password in generator.iter_variations(base_shard, len(pool) + quota, pool)]
+    owners = array('H', [zlib.crc32(candidate) % partitions for candidate in candidates])
+    buckets = [[] for _ in range(partitions)]
+    for candidate, owner in zip(candidates, owners):
+        buckets[owner].append(candidate)
+    for partition, bucket in enumerate(buckets):
+        _write_lines(_parallel_path(folder, round_num, shard, partition) + '.part', bucket)
+    with open(_parallel_path(folder, round_num, shard) + '.order', 'wb') as f:
+        owners.tofile(f)
+
+
+def _dedup_partition(job):
+    """Process-pool worker, step 2: global dedup of one partition.
+
+    Every copy of a candidate lands in the same partition, so keeping the
+    first occurrence in shard order here is exactly what one global pool
+    would keep. Candidates accepted in earlier rounds are reloaded from the
+    partition's '.accepted' file; a '.keep' flag file is written per shard.
+    """
+    folder, round_num, partition, shards, dedup, fp_rate, expected = job
+    seen = make_dedup(dedup, expected, fp_rate)
+    accepted_path = os.path.join(folder, f"{partition}.accepted")
+    if os.path.exists(accepted_path):
+        for line in _read_spill(accepted_path):
+            seen.add(line.decode('utf-8'))
+    with open(accepted_path, 'ab') as accepted:
+        for shard in range(shards):
+            kept = []
+            flags = bytearray()
+            for line in _read_spill(_parallel_path(folder, round_num, shard, partition) + '.part'):
+                keep = seen.add(line.decode('utf-8'))
+                flags.append(keep)
+                if keep:
+                    kept.append(line)
+            with open(_parallel_path(folder, round_num, shard, partition) + '.keep', 'wb') as f:
+                f.write(flags)
+            for data, _ in _byte_batches(iter(kept)):
+                accepted.write(data)
+
+
+def _stitch_shard(job):
+    """Process-pool worker, step 3: the shard's accepted candidates in their original order"""
+    folder, round_num, shard, partitions = job
+    owners = array('H')
+    with open(_parallel_path(folder, round_num, shard) + '.order', 'rb') as f:
+        owners.frombytes(f.read())
+    buckets = []
+    for partition in range(partitions):
+        path = _parallel_path(folder, round_num, shard, partition)
+        with open(path + '.keep', 'rb') as f:
+            flags = f.read()
+        buckets.append(iter(zip(_read_spill(path + '.part'), flags)))
+
+    def survivors():
+        for owner in owners:
+            line, keep = next(buckets[owner])
+            if keep:
+                yield line
+    return _write_lines(_parallel_path(folder, round_num, shard) + '.out', survivors())
+
+
+# ==========[ MERGE WORDLISTS ]==========
+def _iter_raw_lines(path):
+    """Non-empty lines of a wordlist as bytes without line endings"""
+    if is_front_coded(path):
+        with FrontCodedWordlist(path) as reader:
+            yield from reader.iter_raw()
+        return
+    with open_wordlist(path) as f:
+        while True:
+            block = f.readlines(WRITE_BUFFER_SIZE)
+            if not block:
+                return
+            yield from [line for line in (line.rstrip(b'\r\n') for line in block) if line]
+
+
+def _spill(records, tmp_dir):
+    """Write sorted records (bytes without newline) to a temporary spill file"""
+    fd, path = tempfile.mkstemp(prefix='gvdilix_merge_', suffix='.spill', dir=tmp_dir)
+    with os.fdopen(fd, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        for batch, _ in _byte_batches(iter(records)):
+            f.write(batch)
+    return path
+
+
+def _read_spill(path):
+    with open(path, 'rb', buffering=WRITE_BUFFER_SIZE) as f:
+        while True:
+            block = f.readlines(WRITE_BUFFER_SIZE)
+            if not block:
+                return
+            yield from [record[:-1] for record in block]
+
+
+def _merge_spills(paths, tmp_dir, key=None):
+    """Merge spill files MERGE_FAN_IN at a time until one heapq.merge pass is left.
+
+    Adjacent files are merged together, so records that compare equal keep
+    their original (first-seen) relative order.
+    """
+    while len(paths) > MERGE_FAN_IN:
+        merged = []
+        for start in range(0, len(paths), MERGE_FAN_IN):
+            group = paths[start:start + MERGE_FAN_IN]
+            merged.append(_spill(heapq.merge(*map(_read_spill, group), key=key), tmp_dir))
+            for path in group:
+                os.remove(path)
+        paths = merged
+    if len(paths) == 1:
+        return _read_spill(paths[0])
+    return heapq.merge(*map(_read_spill, paths), key=key)
+
+
+def _sorted_runs(lines, chunk_lines, tmp_dir, tagged=False):
+    """Sorted, deduplicated spill files of at most chunk_lines input lines each.
+
+    With tagged=True each record is b'<16 hex digit line number> <line>',
+    keeping the number of the line's first occurrence in the chunk.
+    """
+    paths = []
+    start = 0
+    while True:
+        chunk = list(islice(lines, chunk_lines))
+        if not chunk:
+            return paths
+        if tagged:
+            # Built back to front, so each line keeps its earliest number
+            firsts = dict(zip(reversed(chunk), range(start + len(chunk) - 1, start - 1, -1)))
+            records = [b'%016x %s' % (firsts[line], line) for line in sorted(firsts)]
+        else:
+            records = sorted(set(chunk))
+        paths.append(_spill(records, tmp_dir))
+        start += len(chunk)
+
+
+def _unique(records, key=None):
+    """First record of every run of equal keys (input sorted by key)"""
+    if key is None:
+        return map(itemgetter(0), groupby(records))
+    return (next(group) for _, group in groupby(records, key))
+
+
+def merge_wordlists(inputs, output, first_seen=False, chunk_lines=MERGE_CHUNK_LINES, tmp_dir=None):
+    """Deduplicate any number of wordlists into output, return the line count.
+
+    Chunked external merge sort: at most chunk_lines lines are held in memory,
+    sorted runs go to spill files and are merged with heapq.merge. The result
+    is in byte order, or with first_seen=True in the order lines first appear
+    across the inputs: each line is tagged with a fixed-width sequence number,
+    the first tag per line survives the dedup merge and a second external
+    sort on the tags restores input order. A '.gvfc' output is written
+    front-coded (always sorted).
+    """
+    lines = chain.from_iterable(map(_iter_raw_lines, inputs))
+    if not first_seen:
+        return write_sorted(lines, output, chunk_lines, tmp_dir)
+    if is_front_coded(output):
+        raise ValueError("Front-coded wordlists are always sorted, first-seen order is not available")
+    tmp_dir = tempfile.mkdtemp(prefix='gvdilix_merge_', dir=tmp_dir)
+    try:
+        # Pass 1: runs sorted by line; the merge is stable, so across runs the
+        # earliest tag of each line comes first
+        by_line = lambda record: record[17:]
+        firsts = _unique(_merge_spills(_sorted_runs(lines, chunk_lines, tmp_dir, tagged=True), tmp_dir, by_line),
+                         by_line)
+        # Pass 2: fixed-width hex tags sort bytewise in first-seen order
+        ordered = _merge_spills(_sorted_runs(firsts, chunk_lines, tmp_dir), tmp_dir)
+        return write_blocks(output, _byte_batches(record[17:] for record in ordered))
+    finally:
+        _remove_spill_dir(tmp_dir)
+
+
+def write_sorted(lines, output, chunk_lines=MERGE_CHUNK_LINES, tmp_dir=None):
+    """Sort and deduplicate byte lines (no newline) into output, return the line count.
+
+    Same external sort as merge_wordlists(); the output is in byte order,
+    the order SortedWordlist searches. A '.gvfc' output is front-coded.
+    """
+    tmp_dir = tempfile.mkdtemp(prefix='gvdilix_merge_', dir=tmp_dir)
+    try:
+        unique = _unique(_merge_spills(_sorted_runs(iter(lines), chunk_lines, tmp_dir), tmp_dir))
+        if is_front_coded(output):
+            return FrontCodedWordlist.write(output, unique)
+        return write_blocks(output, _byte_batches(unique))
+    finally:
+        _remove_spill_dir(tmp_dir)
+
+
+def _remove_spill_dir(tmp_dir):
+    for name in os.listdir(tmp_dir):
+        os.remove(os.path.join(tmp_dir, name))
+    os.rmdir(tmp_dir)
+
+
+# ==========[ SORTED LOOKUP ]==========
+class SortedLookup:
+    """Membership and prefix queries over a byte-sorted wordlist.
+
+    Subclasses provide _lower_bound(key, lo), the position of the first
+    line >= key at or after position lo, and _raw_from(position), the raw
+    lines from there on. A query costs one binary search.
+    """
+
+    def __contains__(self, word):
+        key = word.encode('utf-8')
+        return next(self._raw_from(self._lower_bound(key)), None) == key
+
+    def prefix(self, prefix, limit=None):
+        """Lines starting with prefix, in sorted order, at most limit of them"""
+        key = prefix.encode('utf-8')
+        matches = takewhile(lambda line: line.startswith(key), self._raw_from(self._lower_bound(key)))
+        return [line.decode('utf-8', errors='replace') for line in islice(matches, limit)]
+
+    def contains_many(self, words):
+        """Membership of every word, in input order, in one forward pass.
+
+        Queries are searched in sorted order, so each binary search starts
+        where the previous one ended.
+        """
+        keys = [word.encode('utf-8') for word in words]
+        found = set()
+        position = 0
+        for key in sorted(set(keys)):
+            position = self._lower_bound(key, position)
+            if next(self._raw_from(position), None) == key:
+                found.add(key)
+        return [key in found for key in keys]
+
+
+class SortedWordlist(SortedLookup):
+    """Binary search over an mmap of a byte-sorted plain text wordlist.
+
+    Positions are byte offsets of line starts. Each probe finds the line
+    around the middle offset with rfind/find on the map, so a query reads
+    O(log size) lines and never loads the file.
+    """
+
+    def __init__(self, path):
+        if path.endswith(tuple(COMPRESSION_EXTENSIONS.values())):
+            raise ValueError(f"{path} is compressed and cannot be searched in place; "
+                             f"decompress it or convert it to '{FRONT_CODED_EXTENSION}'")
+        self.path = path
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+
+    def _lower_bound(self, key, lo=0):
+        data = self.data
+        hi = len(data)
+        # lo is a line start; lines before lo are < key, the line at hi (if any) is >= key
+        while lo < hi:
+            middle = (lo + hi) // 2
+            start = data.rfind(b'\n', lo, middle) + 1 or lo
+            end = data.find(b'\n', start)
+            if end < 0:
+                end = len(data)
+            if data[start:end] < key:
+                lo = end + 1
+            else:
+                hi = start
+        return min(lo, len(data))
+
+    def _raw_from(self, position):
+        data = self.data
+        while position < len(data):
+            end = data.find(b'\n', position)
+            if end < 0:
+                end = len(data)
+            yield data[position:end]
+            position = end + 1
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_sorted(path):
+    """Lookup reader for a sorted text or front-coded wordlist"""
+    return FrontCodedWordlist(path) if is_front_coded(path) else SortedWordlist(path)
+
+
+# ==========[ FRONT-CODED WORDLISTS ]==========
+def _shared_prefix(a, b):
+    """Length of the common prefix of two byte strings (binary search on slices)"""
+    low, high = 0, min(len(a), len(b))
+    if a[:high] == b[:high]:
+        return high
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[:middle] == b[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+class FrontCodedWordlist(SortedLookup):
+    """Sorted wordlist stored as front-coded, zlib-compressed blocks ('.gvfc').
 
-        return final_passwords
+    Every block of block_lines lines stores, per line, the length of the
+    prefix shared with the previous line and the remaining suffix. The
+    first line of a block is stored whole, so blocks decode independently.
+    Layout: header, blocks, then an index of block offsets. The file is
+    memory-mapped, so reaching line N decodes exactly one block. Lookups
+    binary-search the blocks' first lines, then one block.
+    """
+
+    MAGIC = b'GVFC'
+    HEADER = struct.Struct('<4sHHQQ')  # magic, block lines, zlib level, line count, index offset
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, self.block_lines, self.level, self.line_count, index_offset = self.HEADER.unpack_from(self.data)
+        except struct.error:
+            magic = None
+        if magic != self.MAGIC:
+            self.data.close()
+            raise ValueError(f"{path} is not a front-coded wordlist")
+        self.block_count = -(-self.line_count // self.block_lines)
+        self.offsets = array('Q')
+        self.offsets.frombytes(self.data[index_offset:index_offset + 8 * (self.block_count + 1)])
+        self._cached = (None, None)  # (block number, lines) of the last decoded block
+        self._firsts = {}  # block number -> first line, filled by lookups
+
+    @classmethod
+    def write(cls, path, lines, block_lines=FRONT_CODED_BLOCK_LINES, level=FRONT_CODED_LEVEL):
+        """Encode byte lines (no newline, sorted and unique) into path, return the line count"""
+        lines = iter(lines)
+        offsets = array('Q')
+        line_count = 0
+        with open(path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, block_lines, level, 0, 0))
+            while True:
+                block = list(islice(lines, block_lines))
+                if not block:
+                    break
+                offsets.append(f.tell())
+                f.write(cls._encode_block(block, level))
+                line_count += len(block)
+            offsets.append(f.tell())
+            f.write(offsets.tobytes())
+            f.seek(0)
+            f.write(cls.HEADER.pack(cls.MAGIC, block_lines, level, line_count, offsets[-1]))
+        return line_count
+
+    @staticmethod
+    def _encode_block(block, level):
+        """Type code, shared prefix lengths, suffix lengths, then the suffixes"""
+        typecode = next(code for code in 'BHI' if max(map(len, block)) < 256 ** array(code).itemsize)
+        prefixes = array(typecode)
+        suffixes = []
+        previous = b''
+        for line in block:
+            shared = _shared_prefix(previous, line)
+            prefixes.append(shared)
+            suffixes.append(line[shared:])
+            previous = line
+        raw = typecode.encode('ascii') + prefixes.tobytes() + array(typecode, map(len, suffixes)).tobytes() \
+            + b''.join(suffixes)
+        return zlib.compress(raw, level) if level else raw
+
+    def _unpack(self, number):
+        """(shared prefix lengths, suffix lengths, suffixes) of block number"""
+        raw = self.data[self.offsets[number]:self.offsets[number + 1]]
+        if self.level:
+            raw = zlib.decompress(raw)
+        count = min(self.block_lines, self.line_count - number * self.block_lines)
+        typecode = chr(raw[0])
+        width = count * array(typecode).itemsize
+        return array(typecode, raw[1:1 + width]), array(typecode, raw[1 + width:1 + 2 * width]), raw[1 + 2 * width:]
+
+    def block(self, number):
+        """Lines of block number as bytes"""
+        if self._cached[0] == number:
+            return self._cached[1]
+        prefixes, lengths, suffixes = self._unpack(number)
+        lines = []
+        line = b''
+        start = 0
+        for shared, end in zip(prefixes, accumulate(lengths)):
+            line = line[:shared] + suffixes[start:end]
+            start = end
+            lines.append(line)
+        self._cached = (number, lines)
+        return lines
+
+    def _first(self, number):
+        """First line of block number, stored whole, so no line decoding needed"""
+        first = self._firsts.get(number)
+        if first is None:
+            _, lengths, suffixes = self._unpack(number)
+            first = self._firsts[number] = suffixes[:lengths[0]]
+        return first
+
+    def _lower_bound(self, key, lo=0):
+        """Line number of the first line >= key at or after line lo"""
+        first_block = lo // self.block_lines
+        low, high = first_block, self.block_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._first(middle) <= key:
+                low = middle + 1
+            else:
+                high = middle
+        number = max(low - 1, first_block)
+        if number >= self.block_count:
+            return self.line_count
+        skip = lo - number * self.block_lines if number == first_block else 0
+        return number * self.block_lines + bisect.bisect_left(self.block(number), key, skip)
+
+    def _raw_from(self, line_no):
+        number, skip = divmod(line_no, self.block_lines)
+        for number in range(number, self.block_count):
+            yield from self.block(number)[skip:]
+            skip = 0
+
+    def iter_raw(self):
+        """Every line as bytes, in (byte) sorted order"""
+        for number in range(self.block_count):
+            yield from self.block(number)
+
+    def __iter__(self):
+        for number in range(self.block_count):
+            block = self.block(number)
+            # One decode per block instead of one per line
+            yield from b'\n'.join(block).decode('utf-8', errors='replace').split('\n')
+
+    def __len__(self):
+        return self.line_count
+
+    def read_lines(self, start, count):
+        """Return up to count lines starting at line start (0-based)"""
+        lines = []
+        stop = min(start + count, self.line_count)
+        while start < stop:
+            number, skip = divmod(start, self.block_lines)
+            block = self.block(number)[skip:skip + stop - start]
+            lines.extend(line.decode('utf-8', errors='replace') for line in block)
+            start += len(block)
+        return lines
+
+    def sample_lines(self, k, rng=random):
+        """Uniform random sample of k lines (file order), one block decode per distinct block"""
+        return [self.read_lines(line_no, 1)[0]
+                for line_no in sorted(rng.sample(range(self.line_count), min(k, self.line_count)))]
+
+    def close(self):
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def export_front_coded(path, output):
+    """Decode a front-coded wordlist back into a (possibly compressed) text wordlist"""
+    with FrontCodedWordlist(path) as reader:
+        return write_blocks(output, _byte_batches(reader.iter_raw()))
+
+
+# ==========[ INCREMENTAL GENERATION ]==========
+def checkpoint_path(path):
+    return f"{path}.ckpt"
+
+
+def load_checkpoint(path):
+    """Checkpoint of an interrupted run writing path, None if there is none"""
+    try:
+        with open(checkpoint_path(path), 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def save_checkpoint(path, state):
+    """Atomically replace the checkpoint of the run writing path"""
+    tmp_path = checkpoint_path(path) + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, checkpoint_path(path))
+
+
+def clear_checkpoint(path):
+    if os.path.exists(checkpoint_path(path)):
+        os.remove(checkpoint_path(path))
+
+
+def iter_wordlist_lines(path, limit=None):
+    """Decoded lines of a wordlist, stopping quietly at a truncated compressed tail"""
+    with open_wordlist(path) as f:
+        try:
+            for line in islice(f, limit):
+                if not line.endswith(b'\n'):
+                    return  # Torn last line of an interrupted write
+                yield line[:-1].decode('utf-8', errors='replace')
+        except (EOFError, OSError, lzma.LZMAError):
+            return
+
+
+def recover_wordlist(path, state):
+    """Cut a wordlist back to the last checkpoint of the interrupted run writing it"""
+    if not path.endswith(tuple(COMPRESSION_EXTENSIONS.values())):
+        with open(path, 'r+b') as f:
+            f.truncate(state['size'])
+        return state['lines']
+    # A compressed stream cannot be cut in place: copy the checkpointed lines
+    tmp_path = f"{path}.recover{os.path.splitext(path)[1]}"
+    lines = write_wordlist(tmp_path, iter_wordlist_lines(path, state['lines']))
+    os.replace(tmp_path, path)
+    os.replace(LineIndex.index_path(tmp_path), LineIndex.index_path(path))
+    return lines
+
+
+def checkpointer(path, generator, target_count, params=None):
+    """write_wordlist() checkpoint callback recording how to resume this run.
+
+    params are the manifest params the finished run will record, kept so a
+    resumed run records the same ones.
+    """
+    state = {'profile': generator.data, 'seed': generator.seed, 'options': generator.options(),
+             'target': target_count, 'params': params}
+
+    def checkpoint(lines, size):
+        save_checkpoint(path, dict(state, lines=lines, size=size))
+    return checkpoint
+
+
+def extend_wordlist(path, target_count, generator, pool_size=STREAM_POOL_SIZE, params=None):
+    """Grow an existing wordlist to target_count lines, return the new line count.
+
+    A checkpoint left by an interrupted run is rolled back to first. The
+    file's lines seed the generator's dedup pool, Stages 0-2 replay through
+    it without rewriting anything and only new unique candidates are
+    appended, checkpointing every CHECKPOINT_LINES lines. Front-coded
+    wordlists are rejected, they cannot be appended to.
+    """
+    if is_front_coded(path):
+        raise ValueError(f"{path} is front-coded and cannot be appended to")
+    state = load_checkpoint(path)
+    if state is not None:
+        generator.log(f"[+] Recovering {path} from its checkpoint ({state['lines']:,} lines)")
+        recover_wordlist(path, state)
+    terminate_last_line(path)
+    generator.log(f"[+] Loading {path}...")
+    stream = generator.iter_generate(target_count, pool_size, existing=iter_wordlist_lines(path))
+    written = write_wordlist(path, stream, append=True,
+                             checkpoint=checkpointer(path, generator, target_count, params), pipelined=True)
+    clear_checkpoint(path)
+    return written
+
+
+def extended_params(meta, **changes):
+    """Manifest params of a wordlist after extend_wordlist() appended to it"""
+    params = dict(meta.get('params') or {}, **changes)
+    if params.get('order') == 'sorted':
+        params['order'] = 'generated'  # Appended lines are not in byte order
+    return params
+
+
+def extension_policy(meta, policy=None):
+    """Policy for extend_wordlist(): the one recorded for the file, refusing a different one.
+
+    Appending under other rules would leave the file's lines mixed while
+    the manifest keeps claiming the recorded policy.
+    """
+    if not meta.get('params'):
+        return policy  # Unknown file: nothing recorded to stay consistent with
+    recorded = meta['params'].get('policy')
+    if policy is None:
+        return recorded
+    if recorded is None or json.loads(json.dumps(policy.spec())) != recorded:
+        raise ValueError(f"The file was generated with policy {recorded}; "
+                         f"extend it with the same policy (or none, to reuse it)")
+    return policy
+
+
+def resume_wordlist(path, target_count=None, verbose=True):
+    """Finish the interrupted run that left path's checkpoint, return the line count"""
+    state = load_checkpoint(path)
+    if state is None:
+        raise ValueError(f"No checkpoint for {path}")
+    generator = PasswordGenerator(state['profile'], seed=state['seed'], verbose=verbose, **state['options'])
+    return extend_wordlist(path, target_count or state['target'], generator, params=state.get('params'))
 
 
 # ==========[ GENERATE WORDLIST ]==========
@@ -674,15 +3237,17 @@ def generate_wordlist():
    6) 250,000    (Massive)
    7) 500,000    (Insane)
    8) 1,000,000  (Extreme)
+   9) Dry run    (estimate keyspace only)
 -------------------------------------------
 """)
 
-    choice = input(" Select option (1-8): ").strip()
+    choice = input(" Select option (1-9): ").strip()
 
-    sizes = {
-        "1": 1000, "2": 10000, "3": 25000, "4": 50000,
-        "5": 100000, "6": 250000, "7": 500000, "8": 1000000
-    }
+    if choice == "9":
+        print_keyspace(PasswordGenerator(data, verbose=False).estimate_keyspace())
+        return
+
+    sizes = dict(zip("12345678", SIZE_PRESETS))
 
     if choice not in sizes:
         print(f"[!] Invalid choice. Defaulting to 50,000")
@@ -690,50 +3255,681 @@ def generate_wordlist():
 
     target = sizes[choice]
 
-    print(f"\n[+] Generating EXACTLY {target:,} personal passwords...")
-    print("[+] Based on target's personal information...")
-    start_time = time.time()
+    # Same profile generated before: offer to grow that file instead
+    folder = "GVDILIX_OUTPUT"
+    previous = [(path, meta) for path, meta in (scan_wordlists(folder) if os.path.isdir(folder) else [])
+                if meta.get('profile') == data and (meta.get('params') or {}).get('mode', 'full') == 'full'
+                and not is_front_coded(path) and isinstance(meta.get('lines'), int) and meta['lines'] < target]
+    if previous:
+        path, meta = previous[0]
+        answer = input(f" Extend {os.path.basename(path)} ({meta['lines']:,} lines) to {target:,}? (y/N): ")
+        if answer.strip().lower() == 'y':
+            print(f"\n[+] Appending new passwords to {path}...")
+            start_time = time.time()
+            generator = PasswordGenerator(data, cache_dir=TOKEN_CACHE_DIR, policy=extension_policy(meta))
+            params = extended_params(meta, target=target)
+            written = extend_wordlist(path, target, generator, params=params)
+            record_wordlist(path, written, data, params)
+            print(f"\n✅ SUCCESS: Appended {written - meta['lines']:,} new passwords ({written:,} total)")
+            print(f"✅ File: {path}")
+            print(f"✅ Time: {time.time() - start_time:.2f} seconds")
+            input("\nPress Enter to return to main menu...")
+            return
+
+    cpu_count = os.cpu_count() or 1
+    workers = input(f" Worker processes (1-{cpu_count}, Enter = 1): ").strip()
+    workers = int(workers) if workers.isdigit() and 1 <= int(workers) <= cpu_count else 1
+
+    dedup = input(" Dedup backend (set/compact/bloom, Enter = set): ").strip().lower()
+    if dedup not in DEDUP_BACKENDS:
+        dedup = 'set'
+
+    compression = input(" Compression (none/gzip/bz2/lzma, Enter = none): ").strip().lower()
+    if compression not in COMPRESSION_EXTENSIONS:
+        compression = 'none'
+
+    mode = input(" Output (full/ranked/rules, Enter = full): ").strip().lower()
+    if mode not in ('ranked', 'rules'):
+        mode = 'full'
+
+    policy = None
+    if mode != 'rules':
+        rule = input(" Policy min length/classes (e.g. 10/3, Enter = none): ").strip()
+        min_length, _, min_classes = rule.partition('/')
+        if min_length.isdigit() or min_classes.isdigit():
+            policy = PasswordPolicy(int(min_length) if min_length.isdigit() else 0,
+                                    min_classes=min(int(min_classes), len(POLICY_CLASSES)) if min_classes.isdigit() else 0)
 
     # Initialize generator
-    generator = PasswordGenerator(data)
-
-    # Generate passwords (GUARANTEED)
-    wordlist = generator.generate(target)
+    generator = PasswordGenerator(data, dedup=dedup, cache_dir=TOKEN_CACHE_DIR, policy=policy)
 
     # Save to file
-    folder = "GVDILIX_OUTPUT"
     os.makedirs(folder, exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     target_name = data['name'].lower() if data['name'] else "target"
-    filename = f"{folder}/{target_name}_{target}_{timestamp}.txt"
+    extension = COMPRESSION_EXTENSIONS.get(compression, '')
+
+    if mode == 'rules':
+        # Base words + rule file: the cracker expands candidates on the fly
+        filename = f"{folder}/{target_name}_base_{timestamp}.txt{extension}"
+        print(f"\n[+] Writing base words and rules for {filename}...")
+        start_time = time.time()
+        word_count, rule_count, rule_file = write_rules_output(generator, filename)
+        record_wordlist(filename, word_count, data, {"mode": "rules", "rules": rule_file, "compression": compression})
+        end_time = time.time() - start_time
+
+        print(f"\n✅ SUCCESS: {word_count:,} base words + {rule_count:,} rules")
+        print(f"✅ Words: {filename}")
+        print(f"✅ Rules: {rule_file}")
+        print(f"✅ Time: {end_time:.2f} seconds")
+        print(f"✅ Use: hashcat -a 0 <hashes> {filename} -r {rule_file}")
+        print("\n🔥 GVDILIX - Personal Wordlist Complete!")
+        input("\nPress Enter to return to main menu...")
+        return
 
-    print(f"[+] Saving {len(wordlist):,} passwords to {filename}...")
+    filename = f"{folder}/{target_name}_{target}_{timestamp}.txt{extension}"
 
-    with open(filename, "w", encoding='utf-8') as f:
-        for i, password in enumerate(wordlist, 1):
-            f.write(f"{password}\n")
+    print(f"\n[+] Generating EXACTLY {target:,} personal passwords...")
+    print("[+] Based on target's personal information...")
+    start_time = time.time()
+
+    print(f"[+] Streaming passwords to {filename}...")
+
+    # Generate passwords (GUARANTEED) straight to disk, keeping a small sample
+    if mode == 'ranked':
+        stream = generator.iter_ranked(target, pool_size=STREAM_POOL_SIZE)
+    elif workers > 1:
+        stream = generator.iter_generate_parallel(target, workers, pool_size=STREAM_POOL_SIZE)
+    else:
+        stream = generator.iter_generate(target, pool_size=STREAM_POOL_SIZE)
+    params = {"target": target, "workers": workers, "dedup": dedup, "compression": compression,
+              "mode": mode, "policy": policy.spec() if policy is not None else None}
+    sample = list(islice(stream, 10))
+    # A ranked stream resumed through iter_generate() would lose its order, so it is not checkpointed
+    written = write_wordlist(filename, chain(sample, stream),
+                             checkpoint=None if mode == 'ranked' else checkpointer(filename, generator, target, params),
+                             pipelined=True)
+    clear_checkpoint(filename)
+    record_wordlist(filename, written, data, params)
 
     end_time = time.time() - start_time
 
-    print(f"\n✅ SUCCESS: Generated EXACTLY {len(wordlist):,} personal passwords")
+    print(f"\n✅ SUCCESS: Generated EXACTLY {written:,} personal passwords")
     print(f"✅ File: {filename}")
     print(f"✅ Time: {end_time:.2f} seconds ({end_time / 60:.2f} minutes)")
-    print(f"✅ Speed: {len(wordlist) / end_time:.0f} passwords/second")
+    print(f"✅ Speed: {written / end_time:.0f} passwords/second")
 
     # Show sample
     print("\n📋 Sample passwords (first 10):")
     print("-" * 30)
-    for i, pw in enumerate(wordlist[:10], 1):
+    for i, pw in enumerate(sample, 1):
         print(f"   {i:2}. {pw}")
 
-    if len(wordlist) > 10:
-        print(f"   ... and {len(wordlist) - 10:,} more!")
+    if written > 10:
+        print(f"   ... and {written - 10:,} more!")
 
     print("\n🔥 GVDILIX - Personal Wordlist Complete!")
     input("\nPress Enter to return to main menu...")
 
 
+# ==========[ BATCH MODE ]==========
+def load_profiles(path):
+    """Read profile dicts from a JSONL file, skipping blank lines"""
+    profiles = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            profile = json.loads(line)
+            if not isinstance(profile, dict):
+                raise ValueError(f"{path}:{line_no}: expected a JSON object")
+            profiles.append(profile)
+    return profiles
+
+
+def _profile_slug(profile, number):
+    """Filesystem-safe name for a batch profile's output"""
+    raw = str(profile.get('id') or profile.get('name') or f"profile{number}").lower()
+    slug = ''.join(c if c.isalnum() or c in '-_' else '_' for c in raw).strip('_')
+    return slug or f"profile{number}"
+
+
+def _run_batch_profile(job):
+    """Worker: generate one profile's wordlist quietly, return its summary row"""
+    number, profile, count, folder, stamp, dedup, seed, cache_dir, policy, fp_rate = job
+    start_time = time.time()
+    try:
+        user_data = {key: str(value) for key, value in profile.items() if key not in ('id', 'count')}
+        count = int(profile.get('count', count))
+        filename = os.path.join(folder, f"{_profile_slug(profile, number)}_{count}_{stamp}_{number:04d}.txt")
+        generator = PasswordGenerator(user_data, seed=seed, verbose=False, dedup=dedup, fp_rate=fp_rate,
+                                      cache_dir=cache_dir, policy=policy)
+        written = write_wordlist(filename, generator.iter_generate(count, pool_size=STREAM_POOL_SIZE))
+    except Exception as e:
+        return {'profile': number, 'id': profile.get('id'), 'status': 'error', 'error': str(e)}
+    return {
+        'profile': number,
+        'id': profile.get('id'),
+        'status': 'ok',
+        'file': filename,
+        'lines': written,
+        'seconds': round(time.time() - start_time, 3),
+        'user_data': user_data,
+        'params': {'target': count, 'dedup': dedup, 'seed': seed, 'policy': policy},
+    }
+
+
+def run_batch(profiles_path, count=50000, folder="GVDILIX_OUTPUT", workers=None, dedup='set', seed=None,
+              cache_dir=TOKEN_CACHE_DIR, policy=None, fp_rate=0.001):
+    """Generate one wordlist per JSONL profile on a process pool, return the summary path.
+
+    Each line may carry an optional 'id' (used in file names) and 'count'
+    (overrides the default size); every other key is passed to PasswordGenerator.
+    """
+    profiles = load_profiles(profiles_path)
+    os.makedirs(folder, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    workers = workers or os.cpu_count() or 1
+    jobs = [
+        (number, profile, count, folder, stamp, dedup, None if seed is None else f"{seed}:{number}", cache_dir,
+         policy.spec() if policy is not None else None, fp_rate)
+        for number, profile in enumerate(profiles, 1)
+    ]
+
+    print(f"[+] Batch: {len(jobs)} profile(s) from {profiles_path} on {workers} worker(s)")
+    start_time = time.time()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for result in executor.map(_run_batch_profile, jobs):
+            # Manifest updates stay in this process to avoid concurrent writers
+            if result['status'] == 'ok':
+                record_wordlist(result['file'], result['lines'], result.pop('user_data'), result['params'])
+                print(f"  [✓] #{result['profile']}: {result['lines']:,} -> {result['file']} ({result['seconds']:.2f}s)")
+            else:
+                print(f"  [!] #{result['profile']}: {result['error']}")
+            results.append(result)
+
+    summary = {
+        'source': profiles_path,
+        'profiles': len(jobs),
+        'succeeded': sum(1 for result in results if result['status'] == 'ok'),
+        'seconds': round(time.time() - start_time, 3),
+        'results': results,
+    }
+    summary_path = os.path.join(folder, f"batch_summary_{stamp}.json")
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+
+    print(f"[+] {summary['succeeded']}/{len(jobs)} succeeded in {summary['seconds']:.2f}s")
+    print(f"[+] Summary: {summary_path}")
+    return summary_path
+
+
+# ==========[ COMMAND LINE ]==========
+def load_cli_profile(args):
+    """Profile dict from --profile JSON plus repeated --set KEY=VALUE fields"""
+    data = {}
+    if args.profile:
+        with open(args.profile, 'r', encoding='utf-8') as f:
+            data.update(json.load(f))
+    for field in args.fields:
+        key, sep, value = field.partition('=')
+        if not sep:
+            raise ValueError(f"Expected KEY=VALUE, got '{field}'")
+        data[key.strip()] = value.strip()
+    return {key: str(value) for key, value in data.items()}
+
+
+def run_generate(args):
+    """Headless single-profile generation for the 'generate' command"""
+    data = load_cli_profile(args)
+
+    if args.dry_run:
+        generator = PasswordGenerator(data, verbose=False, combo_depth=args.combo_depth,
+                                      combo_words=args.combo_words or None)
+        estimate = generator.estimate_keyspace()
+        print_keyspace(estimate)
+        if args.count > estimate['total']:
+            print(f"[!] Requested {args.count:,} exceeds the profile keyspace; "
+                  f"~{args.count - estimate['total']:,} would be random mutations.")
+        return
+    if args.extend:
+        run_extend(args, data)
+        return
+
+    to_stdout = args.output == '-'
+    filename = args.output
+    if filename is None:
+        folder = "GVDILIX_OUTPUT"
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"{folder}/{data.get('name', '').lower() or 'target'}_{args.count}_{timestamp}.txt"
+    if not to_stdout:
+        os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+        if args.compress and not filename.endswith(COMPRESSION_EXTENSIONS[args.compress]):
+            filename += COMPRESSION_EXTENSIONS[args.compress]
+
+    # Progress would corrupt a stdout stream, so piped runs are silent
+    stats = None
+    if args.report or args.cprofile or args.trace_memory:
+        if args.workers > 1 and not (args.rules or args.ranked):
+            raise ValueError("--report/--cprofile/--trace-memory instrument the single-process pipeline, "
+                             "drop --workers")
+        stats = GenerationStats(trace_memory=args.trace_memory, profile_path=args.cprofile)
+    policy = policy_from_args(args)
+    generator = PasswordGenerator(data, seed=args.seed, verbose=not to_stdout, dedup=args.dedup,
+                                  fp_rate=args.fp_rate, stats=stats,
+                                  combo_depth=args.combo_depth, combo_words=args.combo_words or None,
+                                  cache_dir=None if args.no_cache else TOKEN_CACHE_DIR, policy=policy)
+    start_time = time.time()
+    if args.rules:
+        if to_stdout:
+            raise ValueError("--rules writes two files and cannot stream to stdout")
+        if args.sorted:
+            raise ValueError("--sorted applies to expanded candidates, not to --rules output")
+        if policy is not None:
+            raise ValueError("A policy filters expanded candidates and cannot apply to --rules output")
+        word_count, rule_count, rule_file = write_rules_output(generator, filename)
+        record_wordlist(filename, word_count, data,
+                        {"mode": "rules", "rules": rule_file, "compression": args.compress or 'none'})
+        print(f"\n✅ SUCCESS: {word_count:,} base words + {rule_count:,} rules")
+        print(f"✅ Words: {filename}")
+        print(f"✅ Rules: {rule_file}")
+        return
+    if args.ranked:
+        stream = generator.iter_ranked(args.count, pool_size=STREAM_POOL_SIZE)
+    elif args.workers > 1:
+        stream = generator.iter_generate_parallel(args.count, args.workers, pool_size=STREAM_POOL_SIZE)
+    else:
+        stream = generator.iter_generate(args.count, pool_size=STREAM_POOL_SIZE)
+    sort_output = args.sorted or is_front_coded(filename)
+    params = {"target": args.count, "workers": args.workers, "dedup": args.dedup,
+              "compression": args.compress or 'none', "mode": 'ranked' if args.ranked else 'full',
+              "order": 'sorted' if sort_output else 'generated',
+              "policy": policy.spec() if policy is not None else None}
+    if sort_output:
+        # Byte order for 'lookup'; an external sort has nothing to checkpoint
+        written = write_sorted((password.encode('utf-8') for password in stream), filename)
+    else:
+        # A ranked stream resumed through iter_generate() would lose its order, so it is not checkpointed
+        resumable = not to_stdout and not args.ranked
+        written = write_wordlist(filename, stream,
+                                 checkpoint=checkpointer(filename, generator, args.count, params) if resumable else None,
+                                 pipelined=not args.no_pipeline)
+    if stats is not None and args.report:
+        stats.save(args.report)
+    if to_stdout:
+        return
+    clear_checkpoint(filename)
+
+    record_wordlist(filename, written, data, params)
+    end_time = time.time() - start_time
+    print(f"\n✅ SUCCESS: Generated EXACTLY {written:,} personal passwords")
+    print(f"✅ File: {filename}")
+    print(f"✅ Time: {end_time:.2f} seconds ({written / max(end_time, 1e-9):.0f} passwords/second)")
+    if args.report:
+        print(f"✅ Report: {args.report}")
+
+
+def run_extend(args, data):
+    """'generate --extend FILE': grow an existing wordlist to --count lines"""
+    filename = args.extend
+    if args.rules or args.ranked or args.workers > 1 or args.sorted:
+        raise ValueError("--extend appends in plain single-process order (no --rules/--ranked/--workers/--sorted)")
+    if not os.path.isfile(filename):
+        raise ValueError(f"No wordlist at {filename}")
+    if is_front_coded(filename):
+        raise ValueError(f"{filename} is front-coded and cannot be appended to; "
+                         f"convert it to text, extend that, then convert back")
+    meta = load_manifest(os.path.dirname(filename) or '.').get(os.path.basename(filename)) or {}
+    mode = (meta.get('params') or {}).get('mode', 'full')
+    if mode != 'full':
+        raise ValueError(f"{filename} was written in '{mode}' mode; only full generations can be extended")
+    if not data:
+        # Reuse the profile the file was generated from
+        data = meta.get('profile') or (load_checkpoint(filename) or {}).get('profile') or {}
+        if not data:
+            raise ValueError(f"No recorded profile for {filename}, pass --profile or --set")
+
+    generator = PasswordGenerator(data, seed=args.seed, dedup=args.dedup, fp_rate=args.fp_rate,
+                                  combo_depth=args.combo_depth, combo_words=args.combo_words or None,
+                                  cache_dir=None if args.no_cache else TOKEN_CACHE_DIR,
+                                  policy=extension_policy(meta, policy_from_args(args)))
+    start_time = time.time()
+    before = LineIndex.open(filename).line_count
+    params = extended_params(meta, target=args.count, dedup=args.dedup)
+    written = extend_wordlist(filename, args.count, generator, params=params)
+    record_wordlist(filename, written, data, params)
+    end_time = time.time() - start_time
+    print(f"\n✅ SUCCESS: Appended {written - before:,} new passwords ({written:,} total)")
+    print(f"✅ File: {filename}")
+    print(f"✅ Time: {end_time:.2f} seconds")
+
+
+def run_resume(args):
+    """'resume FILE': finish an interrupted generation from its checkpoint"""
+    state = load_checkpoint(args.file)
+    if state is None:
+        raise ValueError(f"No checkpoint for {args.file}")
+    start_time = time.time()
+    # Checkpoints from before params were recorded only know the dedup backend and policy
+    params = state.get('params') or {"dedup": state['options']['dedup'], "mode": 'full',
+                                     "policy": state['options'].get('policy')}
+    written = resume_wordlist(args.file, args.count)
+    record_wordlist(args.file, written, state['profile'], dict(params, target=args.count or state['target']))
+    print(f"\n✅ SUCCESS: Resumed {args.file} to {written:,} passwords")
+    print(f"✅ Time: {time.time() - start_time:.2f} seconds")
+
+
+def run_merge(args):
+    """Deduplicate several wordlists into one for the 'merge' command"""
+    for path in args.inputs:
+        if not os.path.isfile(path):
+            raise ValueError(f"No wordlist at {path}")
+    filename = args.output
+    if filename is None:
+        filename = f"GVDILIX_OUTPUT/merged_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+    if filename != '-':
+        os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+        if args.compress and is_front_coded(filename):
+            raise ValueError("Front-coded output is already compressed, drop --compress")
+        if args.compress and not filename.endswith(COMPRESSION_EXTENSIONS[args.compress]):
+            filename += COMPRESSION_EXTENSIONS[args.compress]
+        if os.path.abspath(filename) in map(os.path.abspath, args.inputs):
+            raise ValueError("The merged output cannot overwrite one of its inputs")
+        print(f"[+] Merging {len(args.inputs)} wordlist(s) ({'first-seen' if args.first_seen else 'sorted'} order)...")
+
+    start_time = time.time()
+    written = merge_wordlists(args.inputs, filename, args.first_seen, args.chunk_lines, args.tmp_dir)
+    if filename == '-':
+        return
+    record_wordlist(filename, written, None, {"mode": "merge", "sources": [os.path.basename(path) for path in args.inputs],
+                                             "order": 'first-seen' if args.first_seen else 'sorted'})
+    print(f"\n✅ SUCCESS: {written:,} unique passwords")
+    print(f"✅ File: {filename}")
+    print(f"✅ Time: {time.time() - start_time:.2f} seconds")
+
+
+def run_convert(args):
+    """Convert between text and front-coded wordlists for the 'convert' command"""
+    if not os.path.isfile(args.input):
+        raise ValueError(f"No wordlist at {args.input}")
+    filename = args.output
+    if filename is None:
+        stem = args.input
+        for ext in (FRONT_CODED_EXTENSION,) + tuple(COMPRESSION_EXTENSIONS.values()) + ('.txt',):
+            if stem.endswith(ext):
+                stem = stem[:-len(ext)]
+        filename = stem + ('.txt' if is_front_coded(args.input) else FRONT_CODED_EXTENSION)
+    if filename != '-':
+        if args.compress and not is_front_coded(filename) and not filename.endswith(COMPRESSION_EXTENSIONS[args.compress]):
+            filename += COMPRESSION_EXTENSIONS[args.compress]
+        if os.path.abspath(filename) == os.path.abspath(args.input):
+            raise ValueError("The converted output cannot overwrite its input")
+        os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+
+    start_time = time.time()
+    if is_front_coded(filename):
+        print(f"[+] Sorting {args.input} into front-coded blocks...")
+        written = merge_wordlists([args.input], filename, chunk_lines=args.chunk_lines, tmp_dir=args.tmp_dir)
+    elif is_front_coded(args.input):
+        if filename != '-':
+            print(f"[+] Decoding {args.input}...")
+        written = export_front_coded(args.input, filename)
+    else:
+        raise ValueError(f"Nothing to convert: neither {args.input} nor {filename} is a "
+                         f"'{FRONT_CODED_EXTENSION}' wordlist (use 'merge' to recompress text)")
+    if filename == '-':
+        return
+    record_wordlist(filename, written, None, {"mode": "convert", "source": os.path.basename(args.input),
+                                             "order": 'sorted'})
+    print(f"\n✅ SUCCESS: {written:,} passwords, {os.path.getsize(args.input):,} -> "
+          f"{os.path.getsize(filename):,} bytes")
+    print(f"✅ File: {filename}")
+    print(f"✅ Time: {time.time() - start_time:.2f} seconds")
+
+
+def run_lookup(args):
+    """Membership or prefix queries against a sorted wordlist for the 'lookup' command"""
+    if not os.path.isfile(args.file):
+        raise ValueError(f"No wordlist at {args.file}")
+    meta = load_manifest(os.path.dirname(args.file) or '.').get(os.path.basename(args.file)) or {}
+    # Binary search on an unsorted file silently misses lines: only trust a recorded sorted order
+    if not (args.assume_sorted or is_front_coded(args.file) or (meta.get('params') or {}).get('order') == 'sorted'):
+        raise ValueError(f"{args.file} is not known to be sorted; rebuild it with 'generate --sorted', "
+                         f"a sorted 'merge' or 'convert', or pass --assume-sorted")
+
+    words = list(args.words)
+    if args.queries:
+        with (sys.stdin if args.queries == '-' else open(args.queries, 'r', encoding='utf-8')) as f:
+            words.extend(line.rstrip('\r\n') for line in f if line.strip())
+    if not words and not args.prefixes:
+        raise ValueError("Nothing to look up: pass words, --queries FILE or --prefix")
+
+    with open_sorted(args.file) as wordlist:
+        start_time = time.perf_counter()
+        found = wordlist.contains_many(words)
+        matches = [wordlist.prefix(prefix, args.limit) for prefix in args.prefixes]
+        elapsed = time.perf_counter() - start_time
+
+    for word, present in zip(words, found):
+        print(f"[✓] {word}" if present else f"[!] {word}  (not in list)")
+    for prefix, lines in zip(args.prefixes, matches):
+        print(f"[+] {prefix}*: {len(lines)} match(es){' (limit reached)' if len(lines) == args.limit else ''}")
+        for line in lines:
+            print(f"      {line}")
+
+    print()
+    if words:
+        print(f"✅ {sum(found):,}/{len(words):,} found in {args.file}")
+    if args.prefixes:
+        print(f"✅ {sum(map(bool, matches)):,}/{len(args.prefixes):,} prefixes matched")
+    queries = len(words) + len(args.prefixes)
+    print(f"✅ Time: {elapsed * 1000:.2f} ms ({elapsed * 1e6 / queries:.1f} µs/query)")
+
+
+def run_mask(args):
+    """Enumerate (or sample) a mask for the 'mask' command"""
+    data = load_cli_profile(args)
+    charsets = {str(number): getattr(args, f'charset{number}') for number in range(1, 5)
+                if getattr(args, f'charset{number}')}
+    engine = PasswordGenerator(data, seed=args.seed, verbose=False).mask_engine(args.mask, charsets)
+
+    to_stdout = args.output == '-'
+    filename = args.output
+    if filename is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"GVDILIX_OUTPUT/mask_{data.get('name', '').lower() or 'target'}_{timestamp}.txt"
+    if not to_stdout:
+        os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+        if args.compress and not filename.endswith(COMPRESSION_EXTENSIONS[args.compress]):
+            filename += COMPRESSION_EXTENSIONS[args.compress]
+        print(f"[+] Mask '{args.mask}': {len(engine):,} candidates"
+              + (f", sampling {args.sample:,}" if args.sample else "")
+              + ("" if np is not None else " (NumPy not installed, pure-Python fallback)"))
+
+    start_time = time.time()
+    if args.sample:
+        rng = random.Random(args.seed)
+        written = write_wordlist(filename, chain.from_iterable(
+            engine.sample(min(MASK_BATCH, args.sample - done), rng) for done in range(0, args.sample, MASK_BATCH)))
+    else:
+        written = write_blocks_pipelined(filename, engine.iter_blocks())
+    if to_stdout:
+        return
+
+    record_wordlist(filename, written, data, {"mode": "mask", "mask": args.mask, "sample": args.sample,
+                                              "compression": args.compress or 'none'})
+    end_time = time.time() - start_time
+    print(f"\n✅ SUCCESS: Wrote {written:,} mask candidates")
+    print(f"✅ File: {filename}")
+    print(f"✅ Time: {end_time:.2f} seconds ({written / max(end_time, 1e-9):.0f} passwords/second)")
+
+
+def policy_from_args(args):
+    """PasswordPolicy from the --min-length/--require/... options, None if none are set"""
+    if not (args.min_length or args.max_length or args.min_classes or args.require or args.charset
+            or args.allow or args.deny):
+        return None
+    require = [name.strip() for name in (args.require or '').split(',') if name.strip()]
+    try:
+        return PasswordPolicy(args.min_length, args.max_length, args.min_classes, require, args.charset,
+                              args.allow, args.deny)
+    except re.error as e:
+        raise ValueError(f"Invalid policy regex: {e}")
+
+
+def add_policy_arguments(parser):
+    group = parser.add_argument_group('password policy (only compliant candidates are kept)')
+    group.add_argument('--min-length', type=int, default=0, help="Minimum length")
+    group.add_argument('--max-length', type=int, default=None, help="Maximum length")
+    group.add_argument('--min-classes', type=int, default=0,
+                       help="Minimum number of character classes (lower, upper, digit, symbol)")
+    group.add_argument('--require', metavar='CLASSES', default=None,
+                       help="Comma-separated classes that must appear, e.g. upper,digit")
+    group.add_argument('--charset', default=None, help="Only these characters may appear")
+    group.add_argument('--allow', action='append', default=[], metavar='REGEX',
+                       help="Keep only candidates matching one of these patterns (repeatable)")
+    group.add_argument('--deny', action='append', default=[], metavar='REGEX',
+                       help="Drop candidates matching any of these patterns (repeatable)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='gvdilix.py',
+        description="GVDILIX WordForge - run without arguments for the interactive menu.")
+    commands = parser.add_subparsers(dest='command')
+
+    generate = commands.add_parser('generate', help="Generate one wordlist without prompts")
+    generate.add_argument('--profile', help="JSON file holding one profile dict")
+    generate.add_argument('--set', dest='fields', action='append', default=[], metavar='KEY=VALUE',
+                          help="Profile field, may be repeated (e.g. --set name=John)")
+    generate.add_argument('-n', '--count', type=int, default=50000, help="Passwords to generate (default 50000)")
+    generate.add_argument('-o', '--output', default=None,
+                          help="Output file, '-' for stdout (default: timestamped file in GVDILIX_OUTPUT)")
+    generate.add_argument('--compress', choices=sorted(COMPRESSION_EXTENSIONS), default=None,
+                          help="Compress the output file")
+    generate.add_argument('--rules', action='store_true',
+                          help="Write base words plus a .rule file instead of the expanded list")
+    generate.add_argument('--ranked', action='store_true',
+                          help="Emit candidates in descending likelihood order (single process)")
+    generate.add_argument('--combo-depth', type=int, default=COMBO_DEPTH,
+                          help=f"Tokens per word combination (default {COMBO_DEPTH})")
+    generate.add_argument('--combo-words', type=int, default=COMBO_WORDS,
+                          help=f"Strongest words used in combinations, 0 = all (default {COMBO_WORDS})")
+    generate.add_argument('--extend', metavar='FILE',
+                          help="Append new unique passwords to FILE until it holds --count lines")
+    generate.add_argument('--dry-run', action='store_true',
+                          help="Only estimate the keyspace of every stage, write nothing")
+    generate.add_argument('-w', '--workers', type=int, default=1, help="Worker processes (default 1)")
+    generate.add_argument('--dedup', choices=sorted(DEDUP_BACKENDS), default='set', help="Dedup backend")
+    generate.add_argument('--fp-rate', type=float, default=0.001,
+                          help="False-positive rate of the bloom backend (default 0.001)")
+    generate.add_argument('--seed', default=None, help="Seed for reproducible output")
+    generate.add_argument('--no-cache', action='store_true',
+                          help=f"Recompute profile tokens instead of using the cache in {TOKEN_CACHE_DIR}")
+    generate.add_argument('--sorted', action='store_true',
+                          help="Write the list in byte order so 'lookup' can binary-search it (implied by '.gvfc')")
+    generate.add_argument('--no-pipeline', action='store_true',
+                          help="Generate and write on one thread instead of a separate writer thread")
+    generate.add_argument('--report', metavar='JSON', help="Write a per-stage instrumentation report")
+    generate.add_argument('--trace-memory', action='store_true', help="Include tracemalloc peaks in the report")
+    generate.add_argument('--cprofile', metavar='PATH', help="Dump a cProfile of the Stage 3 hot loop")
+    add_policy_arguments(generate)
+    generate.set_defaults(func=run_generate)
+
+    merge = commands.add_parser('merge', help="Deduplicate wordlists into one with bounded memory")
+    merge.add_argument('inputs', nargs='+', help="Wordlists to merge (plain, compressed or front-coded)")
+    merge.add_argument('-o', '--output', default=None,
+                       help="Output file, '-' for stdout (default: timestamped file in GVDILIX_OUTPUT)")
+    merge.add_argument('--first-seen', action='store_true', help="Keep first-seen order instead of sorting")
+    merge.add_argument('--chunk-lines', type=int, default=MERGE_CHUNK_LINES,
+                       help=f"Lines sorted in memory per spill file (default {MERGE_CHUNK_LINES})")
+    merge.add_argument('--tmp-dir', default=None, help="Folder for spill files (default: system temp)")
+    merge.add_argument('--compress', choices=sorted(COMPRESSION_EXTENSIONS), default=None,
+                       help="Compress the output file")
+    merge.set_defaults(func=run_merge)
+
+    convert = commands.add_parser('convert', help=f"Convert between text and front-coded '{FRONT_CODED_EXTENSION}' wordlists")
+    convert.add_argument('input', help=f"Text wordlist (plain or compressed) or '{FRONT_CODED_EXTENSION}' file")
+    convert.add_argument('-o', '--output', default=None,
+                         help=f"Output file; a '{FRONT_CODED_EXTENSION}' name sorts and front-codes "
+                              f"(default: the input name with the other format's extension)")
+    convert.add_argument('--chunk-lines', type=int, default=MERGE_CHUNK_LINES,
+                         help=f"Lines sorted in memory per spill file (default {MERGE_CHUNK_LINES})")
+    convert.add_argument('--tmp-dir', default=None, help="Folder for spill files (default: system temp)")
+    convert.add_argument('--compress', choices=sorted(COMPRESSION_EXTENSIONS), default=None,
+                         help="Compress the decoded text output")
+    convert.set_defaults(func=run_convert)
+
+    lookup = commands.add_parser('lookup', help="Check words or prefixes against a sorted wordlist")
+    lookup.add_argument('file', help=f"Sorted plain-text or '{FRONT_CODED_EXTENSION}' wordlist")
+    lookup.add_argument('words', nargs='*', help="Words to look up")
+    lookup.add_argument('--queries', metavar='FILE', help="Extra queries, one per line ('-' for stdin)")
+    lookup.add_argument('--prefix', dest='prefixes', action='append', default=[], metavar='PREFIX',
+                        help="List lines starting with PREFIX, may be repeated")
+    lookup.add_argument('--limit', type=int, default=LOOKUP_PREFIX_LIMIT,
+                        help=f"Prefix matches shown per query (default {LOOKUP_PREFIX_LIMIT})")
+    lookup.add_argument('--assume-sorted', action='store_true',
+                        help="Search a file the manifest does not record as sorted (e.g. sorted elsewhere)")
+    lookup.set_defaults(func=run_lookup)
+
+    resume = commands.add_parser('resume', help="Finish an interrupted generation from its checkpoint")
+    resume.add_argument('file', help="Wordlist with a '.ckpt' checkpoint next to it")
+    resume.add_argument('-n', '--count', type=int, default=None, help="New target (default: the original one)")
+    resume.set_defaults(func=run_resume)
+
+    mask = commands.add_parser('mask', help="Enumerate or sample a mask such as ?u?l?l?l?d?d or name?d?d?d?d")
+    mask.add_argument('mask', help="?l ?u ?d ?s ?a ?1-?4 charsets, ?w profile words, ?? literal '?'; "
+                                   "a literal profile field name (e.g. name) expands to its words")
+    mask.add_argument('--profile', help="JSON file holding one profile dict")
+    mask.add_argument('--set', dest='fields', action='append', default=[], metavar='KEY=VALUE',
+                      help="Profile field, may be repeated (e.g. --set name=John)")
+    for number in range(1, 5):
+        mask.add_argument(f'-{number}', dest=f'charset{number}', metavar='CHARS', help=f"Custom charset for ?{number}")
+    mask.add_argument('--sample', type=int, default=0, help="Write N random candidates instead of all")
+    mask.add_argument('-o', '--output', default=None,
+                      help="Output file, '-' for stdout (default: timestamped file in GVDILIX_OUTPUT)")
+    mask.add_argument('--compress', choices=sorted(COMPRESSION_EXTENSIONS), default=None,
+                      help="Compress the output file")
+    mask.add_argument('--seed', default=None, help="Seed for reproducible --sample output")
+    mask.set_defaults(func=run_mask)
+
+    batch = commands.add_parser('batch', help="Generate wordlists for every profile in a JSONL file")
+    batch.add_argument('profiles', help="JSONL file, one PasswordGenerator profile dict per line")
+    batch.add_argument('-n', '--count', type=int, default=50000, help="Passwords per profile (default 50000)")
+    batch.add_argument('-o', '--output', default="GVDILIX_OUTPUT", help="Output folder")
+    batch.add_argument('-w', '--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    batch.add_argument('--dedup', choices=sorted(DEDUP_BACKENDS), default='set', help="Dedup backend")
+    batch.add_argument('--fp-rate', type=float, default=0.001,
+                       help="False-positive rate of the bloom backend (default 0.001)")
+    batch.add_argument('--seed', default=None, help="Base seed for reproducible output")
+    batch.add_argument('--no-cache', action='store_true', help="Recompute profile tokens instead of using the cache")
+    add_policy_arguments(batch)
+    batch.set_defaults(func=lambda args: run_batch(
+        args.profiles, args.count, args.output, args.workers, args.dedup, args.seed,
+        None if args.no_cache else TOKEN_CACHE_DIR, policy_from_args(args), args.fp_rate))
+
+    return parser
+
+
+def run_cli(argv):
+    """Headless entry point, returns a process exit code"""
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        main_menu()
+        return 0
+    if getattr(args, 'output', None) != '-':
+        banner(clear=False)
+    try:
+        args.func(args)
+    except (OSError, ValueError) as e:
+        print(f"[!] Error: {e}")
+        return 1
+    return 0
+
+
 # ==========[ MAIN MENU ]==========
 def main_menu():
     while True:
@@ -762,6 +3958,8 @@ def main_menu():
 
 # ==========[ MAIN PROGRAM ]==========
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
     try:
         main_menu()
     except KeyboardInterrupt: